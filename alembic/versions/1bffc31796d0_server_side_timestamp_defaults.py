@@ -0,0 +1,50 @@
+"""server side timestamp defaults
+
+Revision ID: 1bffc31796d0
+Revises: e7e89a089c6f
+Create Date: 2026-10-15 23:14:56.287681
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1bffc31796d0'
+down_revision: Union[str, None] = 'e7e89a089c6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('sei_processos_temp_etl', 'created_at'),
+    ('sei_etl_status', 'created_at'),
+    ('sei_etl_status', 'updated_at'),
+    ('sei_processos', 'created_at'),
+    ('sei_processos', 'updated_at'),
+    ('sei_documentos', 'created_at'),
+    ('sei_documentos', 'updated_at'),
+    ('sei_andamentos', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            server_default=sa.text("timezone('utc', now())"),
+            existing_type=sa.DateTime(),
+            existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            server_default=None,
+            existing_type=sa.DateTime(),
+            existing_nullable=False
+        )
@@ -0,0 +1,52 @@
+"""json columns to jsonb
+
+Revision ID: 7b052968d7fc
+Revises: a5e060ca88fc
+Create Date: 2026-10-15 23:09:43.570977
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b052968d7fc'
+down_revision: Union[str, None] = 'a5e060ca88fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = [
+    ('sei_processos', 'interessados'),
+    ('sei_processos', 'assuntos'),
+    ('sei_processos', 'raw_api_response'),
+    ('sei_documentos', 'assinantes'),
+    ('sei_documentos', 'raw_api_response'),
+    ('sei_andamentos', 'atributos'),
+    ('sei_andamentos', 'raw_api_response'),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb'
+        )
+
+
+def downgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json'
+        )
@@ -0,0 +1,25 @@
+"""sei_processos_temp_etl unlogged
+
+Revision ID: 9225abfae260
+Revises: f754097e9384
+Create Date: 2026-10-15 23:36:16.529320
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9225abfae260'
+down_revision: Union[str, None] = 'f754097e9384'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE sei_processos_temp_etl SET UNLOGGED')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE sei_processos_temp_etl SET LOGGED')
@@ -0,0 +1,43 @@
+"""documentos composite indexes
+
+Revision ID: a5e060ca88fc
+Revises: e0f2ec6d315c
+Create Date: 2026-10-15 23:06:38.692783
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5e060ca88fc'
+down_revision: Union[str, None] = 'e0f2ec6d315c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_sei_documentos_processo_status', 'sei_documentos', ['processo_id', 'status'], unique=False)
+    op.create_index('ix_sei_documentos_protocol_status', 'sei_documentos', ['protocol', 'status'], unique=False)
+    op.create_index(
+        'ix_sei_documentos_pending', 'sei_documentos', ['created_at'], unique=False,
+        postgresql_where=sa.text("status = 'pending'")
+    )
+    # Índices simples cobertos pelos compostos acima
+    op.drop_index(op.f('ix_sei_documentos_processo_id'), table_name='sei_documentos')
+    op.drop_index(op.f('ix_sei_documentos_protocol'), table_name='sei_documentos')
+    op.drop_index(op.f('ix_sei_documentos_status'), table_name='sei_documentos')
+    # id_protocolo não é usado em nenhum filtro
+    op.drop_index(op.f('ix_sei_processos_id_protocolo'), table_name='sei_processos')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_sei_processos_id_protocolo'), 'sei_processos', ['id_protocolo'], unique=False)
+    op.create_index(op.f('ix_sei_documentos_status'), 'sei_documentos', ['status'], unique=False)
+    op.create_index(op.f('ix_sei_documentos_protocol'), 'sei_documentos', ['protocol'], unique=False)
+    op.create_index(op.f('ix_sei_documentos_processo_id'), 'sei_documentos', ['processo_id'], unique=False)
+    op.drop_index('ix_sei_documentos_pending', table_name='sei_documentos')
+    op.drop_index('ix_sei_documentos_protocol_status', table_name='sei_documentos')
+    op.drop_index('ix_sei_documentos_processo_status', table_name='sei_documentos')
@@ -0,0 +1,35 @@
+"""sei_documentos pending index created_at id
+
+Revision ID: bfde846753f1
+Revises: 9225abfae260
+Create Date: 2026-10-15 23:55:59.707542
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bfde846753f1'
+down_revision: Union[str, None] = '9225abfae260'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_pending_index(columns: list) -> None:
+    op.drop_index('ix_sei_documentos_pending', table_name='sei_documentos')
+    op.create_index(
+        'ix_sei_documentos_pending', 'sei_documentos', columns, unique=False,
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def upgrade() -> None:
+    # (created_at, id): serve o ORDER BY e o keyset da reserva de lotes
+    _recreate_pending_index(['created_at', 'id'])
+
+
+def downgrade() -> None:
+    _recreate_pending_index(['created_at'])
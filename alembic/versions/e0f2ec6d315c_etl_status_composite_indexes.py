@@ -0,0 +1,49 @@
+"""etl status composite indexes
+
+Revision ID: e0f2ec6d315c
+Revises: fd65061c8b08
+Create Date: 2026-10-15 23:06:07.568558
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0f2ec6d315c'
+down_revision: Union[str, None] = 'fd65061c8b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_sei_etl_status_metadata_retry', 'sei_etl_status',
+        ['metadata_status', 'next_retry_at'], unique=False,
+        postgresql_include=['protocol']
+    )
+    op.create_index(
+        'ix_sei_etl_status_documentos_pending', 'sei_etl_status',
+        ['documentos_status', 'next_retry_at'], unique=False,
+        postgresql_where=sa.text("documentos_status = 'pending'")
+    )
+    op.create_index(
+        'ix_sei_etl_status_andamentos_pending', 'sei_etl_status',
+        ['andamentos_status', 'next_retry_at'], unique=False,
+        postgresql_where=sa.text("andamentos_status = 'pending'")
+    )
+    # Índices simples ficam redundantes com os compostos acima
+    op.drop_index(op.f('ix_sei_etl_status_metadata_status'), table_name='sei_etl_status')
+    op.drop_index(op.f('ix_sei_etl_status_documentos_status'), table_name='sei_etl_status')
+    op.drop_index(op.f('ix_sei_etl_status_andamentos_status'), table_name='sei_etl_status')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_sei_etl_status_andamentos_status'), 'sei_etl_status', ['andamentos_status'], unique=False)
+    op.create_index(op.f('ix_sei_etl_status_documentos_status'), 'sei_etl_status', ['documentos_status'], unique=False)
+    op.create_index(op.f('ix_sei_etl_status_metadata_status'), 'sei_etl_status', ['metadata_status'], unique=False)
+    op.drop_index('ix_sei_etl_status_andamentos_pending', table_name='sei_etl_status')
+    op.drop_index('ix_sei_etl_status_documentos_pending', table_name='sei_etl_status')
+    op.drop_index('ix_sei_etl_status_metadata_retry', table_name='sei_etl_status')
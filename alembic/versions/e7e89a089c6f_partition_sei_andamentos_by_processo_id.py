@@ -0,0 +1,87 @@
+"""partition sei_andamentos by processo_id
+
+Revision ID: e7e89a089c6f
+Revises: 7b052968d7fc
+Create Date: 2026-10-15 23:12:08.078160
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7e89a089c6f'
+down_revision: Union[str, None] = '7b052968d7fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITIONS = 16
+
+COLUMNS = (
+    'id, processo_id, protocol, id_andamento, sequencia, tipo_andamento, descricao, tarefa, '
+    'usuario, unidade_origem, unidade_destino, data_hora, atributos, raw_api_response, created_at'
+)
+
+
+def _create_andamentos_table(**table_kwargs) -> None:
+    """Cria sei_andamentos (sem índices) reaproveitando a sequence de id existente."""
+    primary_key = ['id', 'processo_id'] if 'postgresql_partition_by' in table_kwargs else ['id']
+    op.create_table('sei_andamentos',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('sei_andamentos_id_seq'::regclass)"), nullable=False),
+    sa.Column('processo_id', sa.Integer(), nullable=False),
+    sa.Column('protocol', sa.String(length=50), nullable=False),
+    sa.Column('id_andamento', sa.BigInteger(), nullable=True),
+    sa.Column('sequencia', sa.Integer(), nullable=True),
+    sa.Column('tipo_andamento', sa.String(length=255), nullable=True),
+    sa.Column('descricao', sa.Text(), nullable=True),
+    sa.Column('tarefa', sa.String(length=50), nullable=True),
+    sa.Column('usuario', sa.String(length=255), nullable=True),
+    sa.Column('unidade_origem', sa.String(length=255), nullable=True),
+    sa.Column('unidade_destino', sa.String(length=255), nullable=True),
+    sa.Column('data_hora', sa.DateTime(), nullable=True),
+    sa.Column('atributos', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('raw_api_response', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['processo_id'], ['sei_processos.id'], ),
+    sa.PrimaryKeyConstraint(*primary_key),
+    **table_kwargs
+    )
+
+
+def _swap_andamentos_table(**table_kwargs) -> None:
+    """Recria sei_andamentos com as opções dadas e copia as linhas da tabela antiga."""
+    op.drop_index(op.f('ix_sei_andamentos_protocol'), table_name='sei_andamentos')
+    op.drop_index(op.f('ix_sei_andamentos_processo_id'), table_name='sei_andamentos')
+    op.drop_index(op.f('ix_sei_andamentos_data_hora'), table_name='sei_andamentos')
+    op.execute('ALTER SEQUENCE sei_andamentos_id_seq OWNED BY NONE')
+    op.rename_table('sei_andamentos', 'sei_andamentos_old')
+    op.execute('ALTER TABLE sei_andamentos_old RENAME CONSTRAINT sei_andamentos_pkey TO sei_andamentos_old_pkey')
+
+    _create_andamentos_table(**table_kwargs)
+    if 'postgresql_partition_by' in table_kwargs:
+        for remainder in range(PARTITIONS):
+            op.execute(
+                f'CREATE TABLE sei_andamentos_p{remainder} PARTITION OF sei_andamentos '
+                f'FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})'
+            )
+
+    op.execute(f'INSERT INTO sei_andamentos ({COLUMNS}) SELECT {COLUMNS} FROM sei_andamentos_old')
+    op.drop_table('sei_andamentos_old')
+    op.execute('ALTER SEQUENCE sei_andamentos_id_seq OWNED BY sei_andamentos.id')
+
+    # Índices no pai são propagados para cada partição
+    op.create_index(op.f('ix_sei_andamentos_data_hora'), 'sei_andamentos', ['data_hora'], unique=False)
+    op.create_index(op.f('ix_sei_andamentos_processo_id'), 'sei_andamentos', ['processo_id'], unique=False)
+    op.create_index(op.f('ix_sei_andamentos_protocol'), 'sei_andamentos', ['protocol'], unique=False)
+
+
+def upgrade() -> None:
+    _swap_andamentos_table(postgresql_partition_by='HASH (processo_id)')
+
+
+def downgrade() -> None:
+    _swap_andamentos_table()
@@ -0,0 +1,88 @@
+"""status columns to enum
+
+Revision ID: f754097e9384
+Revises: 1bffc31796d0
+Create Date: 2026-10-15 23:15:43.294350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f754097e9384'
+down_revision: Union[str, None] = '1bffc31796d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+etl_status = postgresql.ENUM(
+    'pending', 'processing', 'completed', 'error', 'not_found', 'access_denied',
+    name='etl_status', create_type=False
+)
+documento_status = postgresql.ENUM(
+    'pending', 'downloading', 'completed', 'error',
+    name='documento_status', create_type=False
+)
+
+STATUS_COLUMNS = [
+    ('sei_etl_status', 'metadata_status', etl_status),
+    ('sei_etl_status', 'documentos_status', etl_status),
+    ('sei_etl_status', 'andamentos_status', etl_status),
+    ('sei_documentos', 'status', documento_status),
+]
+
+# Índices parciais cujo predicado referencia as colunas de status: o predicado
+# precisa ser recriado para o novo tipo (o cast enum -> text não é IMMUTABLE)
+PARTIAL_INDEXES = [
+    ('ix_sei_etl_status_documentos_pending', 'sei_etl_status', ['documentos_status', 'next_retry_at'], "documentos_status = 'pending'"),
+    ('ix_sei_etl_status_andamentos_pending', 'sei_etl_status', ['andamentos_status', 'next_retry_at'], "andamentos_status = 'pending'"),
+    ('ix_sei_documentos_pending', 'sei_documentos', ['created_at'], "status = 'pending'"),
+]
+
+
+def _drop_partial_indexes() -> None:
+    for name, table, _, _ in PARTIAL_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def _create_partial_indexes() -> None:
+    for name, table, columns, where in PARTIAL_INDEXES:
+        op.create_index(name, table, columns, unique=False, postgresql_where=sa.text(where))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    etl_status.create(bind, checkfirst=True)
+    documento_status.create(bind, checkfirst=True)
+
+    _drop_partial_indexes()
+    for table, column, enum_type in STATUS_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=enum_type,
+            existing_type=sa.String(length=50),
+            existing_nullable=True,
+            postgresql_using=f'{column}::{enum_type.name}'
+        )
+    _create_partial_indexes()
+
+
+def downgrade() -> None:
+    _drop_partial_indexes()
+    for table, column, enum_type in STATUS_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(length=50),
+            existing_type=enum_type,
+            existing_nullable=True,
+            postgresql_using=f'{column}::text'
+        )
+    _create_partial_indexes()
+
+    bind = op.get_bind()
+    documento_status.drop(bind, checkfirst=True)
+    etl_status.drop(bind, checkfirst=True)
@@ -8,17 +8,14 @@ Implementa:
 - Logging estruturado
 """
 import asyncio
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict, defaultdict
+from enum import Enum
+from functools import partial
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Callable
 import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
 from loguru import logger
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log
-)
 
 
 class SeiPermanentError(Exception):
@@ -41,8 +38,33 @@ class SeiUnidadeAccessError(Exception):
     pass
 
 
+class SeiErrorKind(Enum):
+    """Classificação de uma resposta de erro da API SEI."""
+    ACCESS = 'access'        # Unidade sem acesso ao processo (tentar outras unidades)
+    PERMANENT = 'permanent'  # Erro permanente (não retentar)
+    TRANSIENT = 'transient'  # Demais erros (segue fluxo normal de retry)
+
+
 class SeiAPIClient:
-    """Cliente assíncrono para a API do SEI."""
+    """Cliente assíncrono para a API do SEI.
+
+    Mensagens de debug usam argumentos posicionais do loguru em vez de
+    f-strings: a formatação só acontece se algum sink aceitar DEBUG.
+    """
+
+    # Tamanho máximo do cache LRU de consultar_processo/consultar_documento
+    _CONSULTA_CACHE_SIZE = 4096
+
+    # Padrões de mensagem (comparados em casefold) usados para classificar erros
+    _ACCESS_PATTERNS = ('não possui acesso ao processo', 'does not have access to process')
+    _PERMANENT_PATTERNS = ('não encontrado', 'not found', 'não existe', 'does not exist')
+
+    # Listas paginadas de um processo: list_key -> (trecho do endpoint, params extras)
+    _PROCESS_LISTS = {
+        'Documentos': ('documentos', {"sinal_completo": "S"}),
+        'Andamentos': ('andamentos', {"sinal_atributos": "S"}),
+    }
+    _ITENS_POR_PAGINA = 200
 
     def __init__(
         self,
@@ -52,6 +74,7 @@ class SeiAPIClient:
         orgao: str = "GOV-PI",
         max_concurrent: int = 10,
         timeout: int = 30,
+        rate_limit: Optional[float] = None,
     ):
         """
         Inicializa o cliente da API SEI.
@@ -63,26 +86,41 @@ class SeiAPIClient:
             orgao: Órgão do usuário
             max_concurrent: Máximo de requisições concorrentes
             timeout: Timeout em segundos
+            rate_limit: Máximo de requisições por segundo (padrão: max_concurrent)
         """
         self.base_url = base_url.rstrip('/')
         self.usuario = usuario
         self.senha = senha
         self.orgao = orgao
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # Downloads de documentos podem levar mais que `timeout` no total:
+        # o limite vale para a conexão e para cada leitura do socket
+        self.download_timeout = aiohttp.ClientTimeout(total=None, connect=10, sock_read=timeout)
 
         # Controle de concorrência
+        self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        # Token bucket: suaviza rajadas para evitar 429 da API
+        self.limiter = AsyncLimiter(rate_limit or max_concurrent, 1.0)
 
         # Token de autenticação
         self._token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
-        self._token_lock = asyncio.Lock()  # Lock para evitar múltiplos logins simultâneos
+        # Prazo de validade no relógio monotônico do event loop (segundos)
+        self._token_expires_monotonic: float = 0.0
+        # Login em andamento (single-flight): todos os chamadores aguardam o mesmo Future
+        self._token_refresh_future: Optional[asyncio.Future] = None
 
         # Unidades disponíveis (sigla -> id)
         self._unidades: Dict[str, str] = {}
 
-        # Cache de unidades por órgão (evita recálculo)
-        self._unidades_por_orgao_cache: Dict[str, List[tuple]] = {}
+        # Cache de resolução sigla do processo -> id da unidade (inclui não encontradas)
+        self._sigla_cache: Dict[str, Optional[str]] = {}
+
+        # Cache LRU das consultas de processo/documento (limpo a cada login)
+        self._consulta_cache: OrderedDict[Tuple[str, ...], Dict[str, Any]] = OrderedDict()
+
+        # Unidades por órgão raiz já ordenadas: orgao -> [(sigla, id)], mais específicas primeiro
+        self._unidades_sorted_by_orgao: Dict[str, List[Tuple[str, str]]] = {}
 
         # Session
         self._session: Optional[aiohttp.ClientSession] = None
@@ -99,9 +137,19 @@ class SeiAPIClient:
     async def start(self):
         """Inicia a sessão HTTP."""
         if self._session is None or self._session.closed:
+            # Pool de conexões dimensionado pelo semáforo (API tem um único host)
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.max_concurrent,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=self.timeout,
-                headers={'Content-Type': 'application/json'}
+                headers={'Content-Type': 'application/json'},
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
             )
             logger.debug("Sessão HTTP iniciada")
 
@@ -126,147 +174,165 @@ class SeiAPIClient:
         if not sigla_processo:
             return None
 
+        # Cache de resoluções anteriores (hit e miss)
+        if sigla_processo in self._sigla_cache:
+            return self._sigla_cache[sigla_processo]
+
         # Garante que temos o token (e as unidades carregadas)
         # Só chama _get_token se ainda não temos unidades
         if not self._unidades:
             await self._get_token()
 
         # Tenta match exato primeiro
-        if sigla_processo in self._unidades:
-            return self._unidades[sigla_processo]
-
-        # Tenta match por prefixo (da mais específica para menos)
-        # Ex: "SEAD-PI/GAB/SUPARC" -> tenta "SEAD-PI/GAB", depois "SEAD-PI"
-        parts = sigla_processo.split('/')
-        for i in range(len(parts) - 1, 0, -1):
-            prefix = '/'.join(parts[:i])
-            if prefix in self._unidades:
-                logger.debug(f"Match de unidade: {sigla_processo} -> {prefix}")
-                return self._unidades[prefix]
-
-        # Debug: mostra unidades disponíveis que começam com o mesmo prefixo
-        orgao = sigla_processo.split('/')[0] if '/' in sigla_processo else sigla_processo
-        matching = [s for s in self._unidades.keys() if s.startswith(orgao)]
-
-        logger.warning(
-            f"Unidade não encontrada para: {sigla_processo}. "
-            f"Unidades disponíveis do órgão {orgao}: {len(matching)} "
-            f"(primeiras 5: {matching[:5]})"
-        )
-        return None
-
-    async def get_all_unidades_do_orgao(self, orgao_prefix: str) -> List[tuple]:
+        id_unidade = self._unidades.get(sigla_processo)
+
+        if id_unidade is None:
+            # Tenta match por prefixo (da mais específica para menos), subindo
+            # um nível por vez com lookups O(1) no dicionário
+            # Ex: "SEAD-PI/GAB/SUPARC/X" -> "SEAD-PI/GAB/SUPARC", "SEAD-PI/GAB", "SEAD-PI"
+            sigla = sigla_processo
+            while '/' in sigla:
+                sigla = sigla.rsplit('/', 1)[0]
+                id_unidade = self._unidades.get(sigla)
+                if id_unidade is not None:
+                    logger.debug("Match de unidade: {} -> {}", sigla_processo, sigla)
+                    break
+            else:
+                orgao = sigla_processo.split('/', 1)[0]
+                candidatas = self._unidades_sorted_by_orgao.get(orgao, [])
+                logger.warning(
+                    f"Unidade não encontrada para: {sigla_processo}. "
+                    f"Unidades disponíveis do órgão {orgao}: {len(candidatas)} "
+                    f"(primeiras 5: {[sigla for sigla, _ in candidatas[:5]]})"
+                )
+
+        self._sigla_cache[sigla_processo] = id_unidade
+        return id_unidade
+
+    async def get_all_unidades_do_orgao(self, orgao_prefix: str) -> List[Tuple[str, str]]:
         """Obtém todas as unidades disponíveis de um órgão específico.
 
-        Usa cache para evitar recálculo em chamadas repetidas.
+        A lista é pré-calculada no login (ver `_get_token`), então a
+        consulta é apenas um acesso ao dicionário.
 
         Args:
-            orgao_prefix: Prefixo do órgão (ex: "SEAD-PI", "SEDUC-PI")
+            orgao_prefix: Órgão raiz (ex: "SEAD-PI", "SEDUC-PI")
 
         Returns:
             Lista de tuplas (sigla, id_unidade) ordenadas por especificidade
+            (ex: "SEAD-PI/GAB/SUPARC" vem antes de "SEAD-PI/GAB")
         """
-        # Verifica cache primeiro
-        if orgao_prefix in self._unidades_por_orgao_cache:
-            return self._unidades_por_orgao_cache[orgao_prefix]
-
         # Garante que temos as unidades carregadas
         if not self._unidades:
             await self._get_token()
 
-        # Filtra unidades do órgão e ordena por especificidade (mais níveis primeiro)
-        unidades_orgao = [
-            (sigla, id_unidade)
-            for sigla, id_unidade in self._unidades.items()
-            if sigla.startswith(orgao_prefix)
-        ]
-
-        # Ordena por número de níveis (mais específicas primeiro)
-        # Ex: "SEAD-PI/GAB/SUPARC" vem antes de "SEAD-PI/GAB"
-        unidades_orgao.sort(key=lambda x: x[0].count('/'), reverse=True)
+        return self._unidades_sorted_by_orgao.get(orgao_prefix, [])
 
-        # Armazena no cache
-        self._unidades_por_orgao_cache[orgao_prefix] = unidades_orgao
+    def _token_if_fresh(self) -> Optional[str]:
+        """Retorna o token atual se ainda for válido, sem suspender a coroutine.
 
-        return unidades_orgao
+        Returns:
+            Token JWT válido ou None se for necessário autenticar
+        """
+        if self._token and asyncio.get_running_loop().time() < self._token_expires_monotonic:
+            return self._token
+        return None
 
     async def _get_token(self) -> str:
         """Obtém ou renova o token de autenticação.
 
+        Se vários coroutines encontram o token expirado ao mesmo tempo,
+        apenas um login é disparado e todos aguardam o mesmo resultado.
+
         Returns:
             Token JWT
         """
-        # Fast path - verifica se token ainda é válido (sem lock)
-        if self._token and self._token_expires_at:
-            if datetime.now(timezone.utc) < self._token_expires_at - timedelta(minutes=5):
-                return self._token
+        # Fast path - token ainda é válido
+        token = self._token_if_fresh()
+        if token:
+            return token
 
-        # Slow path - precisa fazer login (adquire lock)
-        async with self._token_lock:
-            # Double-check após adquirir lock (outro coroutine pode ter feito login)
-            if self._token and self._token_expires_at:
-                if datetime.now(timezone.utc) < self._token_expires_at - timedelta(minutes=5):
-                    return self._token
+        # Slow path - reutiliza o login em andamento ou dispara um novo
+        if self._token_refresh_future is None or self._token_refresh_future.done():
+            self._token_refresh_future = asyncio.ensure_future(self._login())
 
-            # Faz login para obter novo token
-            logger.info("Autenticando na API SEI...")
+        # shield: cancelar um chamador não cancela o login compartilhado
+        return await asyncio.shield(self._token_refresh_future)
 
-            url = f"{self.base_url}/v1/orgaos/usuarios/login"
-            payload = {
-                "Usuario": self.usuario,
-                "Senha": self.senha,
-                "Orgao": self.orgao
-            }
+    async def _login(self) -> str:
+        """Autentica na API e recarrega o mapeamento de unidades.
 
-            try:
-                async with self._session.post(url, json=payload) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    # Token vem com T maiúsculo: "Token"
-                    self._token = data.get('Token')
-
-                    if not self._token:
-                        logger.error(f"Token não encontrado na resposta! Keys: {list(data.keys())}")
-                        raise ValueError("Token não encontrado na resposta de autenticação")
-
-                    # API não retorna expiração, assume 1 hora
-                    self._token_expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        Returns:
+            Token JWT
+        """
+        loop = asyncio.get_running_loop()
 
-                    # Armazena mapeamento de unidades (sigla -> id)
-                    unidades_list = data.get('Unidades', [])
-                    self._unidades = {
-                        unidade.get('Sigla'): unidade.get('Id')
-                        for unidade in unidades_list
-                        if unidade.get('Sigla') and unidade.get('Id')
-                    }
+        # Faz login para obter novo token
+        logger.info("Autenticando na API SEI...")
 
-                    # Limpa cache de unidades por órgão (será recalculado sob demanda)
-                    self._unidades_por_orgao_cache.clear()
+        url = f"{self.base_url}/v1/orgaos/usuarios/login"
+        payload = {
+            "Usuario": self.usuario,
+            "Senha": self.senha,
+            "Orgao": self.orgao
+        }
 
-                    logger.success(
-                        f"Autenticado com sucesso (token expira em ~1h). "
-                        f"Acesso a {len(self._unidades)} unidades."
-                    )
-                    return self._token
+        try:
+            async with self._session.post(url, json=payload) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+
+                # Token vem com T maiúsculo: "Token"
+                self._token = data.get('Token')
+
+                if not self._token:
+                    logger.error(f"Token não encontrado na resposta! Keys: {list(data.keys())}")
+                    raise ValueError("Token não encontrado na resposta de autenticação")
+
+                # API não retorna expiração, assume 1 hora (renova 5 min antes)
+                self._token_expires_monotonic = loop.time() + 3300.0
+
+                # Armazena mapeamento de unidades (sigla -> id)
+                unidades_list = data.get('Unidades', [])
+                self._unidades = {
+                    unidade.get('Sigla'): unidade.get('Id')
+                    for unidade in unidades_list
+                    if unidade.get('Sigla') and unidade.get('Id')
+                }
+
+                # Indexa unidades por órgão raiz, da mais específica para a menos
+                unidades_by_orgao = defaultdict(list)
+                for sigla, id_unidade in self._unidades.items():
+                    orgao = sigla.split('/', 1)[0]
+                    unidades_by_orgao[orgao].append((-sigla.count('/'), sigla, id_unidade))
+                for unidades_orgao in unidades_by_orgao.values():
+                    unidades_orgao.sort()
+                self._unidades_sorted_by_orgao = {
+                    orgao: [(sigla, id_unidade) for _, sigla, id_unidade in unidades_orgao]
+                    for orgao, unidades_orgao in unidades_by_orgao.items()
+                }
+
+                # Limpa caches derivados (recalculados sob demanda)
+                self._sigla_cache.clear()
+                self._consulta_cache.clear()
+
+                logger.success(
+                    f"Autenticado com sucesso (token expira em ~1h). "
+                    f"Acesso a {len(self._unidades)} unidades."
+                )
+                return self._token
 
-            except aiohttp.ClientError as e:
-                logger.error(f"Erro ao autenticar: {e}")
-                raise
+        except aiohttp.ClientError as e:
+            logger.error(f"Erro ao autenticar: {e}")
+            raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
-        before_sleep=before_sleep_log(logger, "WARNING")
-    )
     async def _request(
         self,
         method: str,
         endpoint: str,
         **kwargs
     ) -> Dict[str, Any]:
-        """Faz requisição HTTP com retry e rate limiting.
+        """Faz requisição HTTP (ver `_request_raw`) e decodifica o JSON.
 
         Args:
             method: Método HTTP (GET, POST, etc)
@@ -276,118 +342,151 @@ class SeiAPIClient:
         Returns:
             Resposta JSON da API
         """
-        async with self.semaphore:
-            # Garante que temos token
-            token = await self._get_token()
-
-            # Adiciona token ao header
-            headers = kwargs.get('headers', {})
-            headers['token'] = token
-            kwargs['headers'] = headers
-
-            # URL completa
-            url = f"{self.base_url}{endpoint}"
-
-            logger.debug(f"{method} {url}")
+        return await self._request_raw(method, endpoint, decode=orjson.loads, **kwargs)
 
-            try:
-                async with self._session.request(method, url, **kwargs) as response:
-                    # Log de resposta
-                    logger.debug(f"Status: {response.status}")
-
-                    # Trata erros HTTP
-                    if response.status == 401:
-                        # Token inválido, limpa e tenta novamente
-                        logger.warning("Token inválido, reautenticando...")
-                        self._token = None
-                        raise aiohttp.ClientError("Token inválido")
-
-                    elif response.status == 429:
-                        # Rate limit
-                        logger.warning("Rate limit atingido, aguardando...")
-                        await asyncio.sleep(5)
-                        raise aiohttp.ClientError("Rate limit")
-
-                    # Para erros 4xx e 5xx, verifica tipo de erro
-                    if response.status >= 400:
-                        try:
-                            error_data = await response.json()
-
-                            # Detecta erro de acesso da unidade (deve tentar outras)
-                            if self._is_unidade_access_error(error_data):
-                                error_msg = self._extract_error_message(error_data)
-                                logger.debug(f"Erro de acesso da unidade: {error_msg}")
-                                raise SeiUnidadeAccessError(error_msg)
-
-                            # Detecta erros permanentes (não retentáveis)
-                            if self._is_permanent_error(error_data):
-                                error_msg = self._extract_error_message(error_data)
-                                logger.warning(f"Erro permanente detectado: {error_msg}")
-                                raise SeiPermanentError(error_msg)
-                        except (aiohttp.ContentTypeError, ValueError):
-                            # Se não conseguir parsear JSON, segue com raise_for_status normal
-                            pass
+    @staticmethod
+    def _extract_list(raw: bytes, list_key: str) -> List[Dict[str, Any]]:
+        """Decodifica uma página e retorna apenas a lista de itens.
 
-                    response.raise_for_status()
+        Args:
+            raw: Corpo da resposta
+            list_key: Chave da lista de itens (ex: 'Documentos')
 
-                    # Retorna JSON
-                    return await response.json()
+        Returns:
+            Itens da página
+        """
+        data = orjson.loads(raw)
+        return data if isinstance(data, list) else data.get(list_key, [])
 
-            except SeiPermanentError:
-                # Repropaga erros permanentes sem modificar
-                raise
-            except aiohttp.ClientError as e:
-                logger.error(f"Erro na requisição {method} {url}: {e}")
-                raise
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        **kwargs
+    ) -> Any:
+        """Faz requisição HTTP com retry e rate limiting.
 
-    def _is_unidade_access_error(self, error_data: Dict[str, Any]) -> bool:
-        """Verifica se o erro é de acesso de uma unidade específica ao processo.
+        Erros de rede e timeouts são retentados até 3 vezes com backoff
+        exponencial (2s, 4s, máximo 10s). Erros permanentes e de acesso da
+        unidade são propagados imediatamente. O corpo é decodificado dentro
+        do retry: uma resposta 2xx que não é JSON válido (ex: página de erro
+        de um proxy) também é retentada.
 
         Args:
-            error_data: Dados do erro retornado pela API
+            method: Método HTTP (GET, POST, etc)
+            endpoint: Endpoint da API (ex: /v1/unidades/123/procedimentos)
+            decode: Decodificador do corpo (None = bytes sem decodificar)
+            **kwargs: Argumentos adicionais para aiohttp
 
         Returns:
-            True se for erro de acesso da unidade
+            Corpo da resposta, decodificado por `decode` quando informado
         """
-        if not isinstance(error_data, dict):
-            return False
+        # URL e headers são montados uma única vez; só o token muda entre tentativas
+        url = self.base_url + endpoint
+        headers = dict(kwargs.pop('headers', None) or {})
 
-        detail = error_data.get('detail', [])
-        if not isinstance(detail, list):
-            return False
-
-        for error_item in detail:
-            if not isinstance(error_item, dict):
+        for attempt in range(3):
+            try:
+                async with self.semaphore, self.limiter:
+                    # Garante que temos token (renovado após um 401)
+                    headers['token'] = self._token_if_fresh() or await self._get_token()
+
+                    logger.debug("{} {}", method, url)
+
+                    async with self._session.request(method, url, headers=headers, **kwargs) as response:
+                        # Log de resposta
+                        logger.debug("Status: {}", response.status)
+
+                        # Trata erros HTTP
+                        if response.status == 401:
+                            # Token inválido, limpa e tenta novamente
+                            logger.warning("Token inválido, reautenticando...")
+                            self._token = None
+                            raise aiohttp.ClientError("Token inválido")
+
+                        elif response.status == 429:
+                            # Rate limit - respeita Retry-After (segundos) quando presente
+                            retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                            logger.warning(f"Rate limit atingido, aguardando {retry_after:.0f}s...")
+                            await asyncio.sleep(retry_after)
+                            raise aiohttp.ClientError("Rate limit")
+
+                        # Para erros 4xx e 5xx, verifica tipo de erro
+                        if response.status >= 400:
+                            try:
+                                error_data = orjson.loads(await response.read())
+                                error_kind = self._classify_error(error_data)
+
+                                # Detecta erro de acesso da unidade (deve tentar outras)
+                                if error_kind is SeiErrorKind.ACCESS:
+                                    error_msg = self._extract_error_message(error_data)
+                                    logger.debug("Erro de acesso da unidade: {}", error_msg)
+                                    raise SeiUnidadeAccessError(error_msg)
+
+                                # Detecta erros permanentes (não retentáveis)
+                                if error_kind is SeiErrorKind.PERMANENT:
+                                    error_msg = self._extract_error_message(error_data)
+                                    logger.warning(f"Erro permanente detectado: {error_msg}")
+                                    raise SeiPermanentError(error_msg)
+                            except (aiohttp.ContentTypeError, ValueError):
+                                # Se não conseguir parsear JSON, segue com raise_for_status normal
+                                pass
+
+                        response.raise_for_status()
+
+                        body = await response.read()
+                        return decode(body) if decode else body
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+                logger.error(f"Erro na requisição {method} {endpoint}: {e}")
+                if attempt == 2:
+                    raise
+                # Backoff exponencial: 2s, 4s (máximo 10s)
+                delay = min(2 * (2 ** attempt), 10)
+                logger.warning(f"Tentativa {attempt + 1}/3 falhou, aguardando {delay}s...")
+                await asyncio.sleep(delay)
                 continue
 
-            msg = error_item.get('msg', '')
-            if not isinstance(msg, str):
-                continue
+    @staticmethod
+    def _parse_retry_after(value: Optional[str], default: float = 5.0) -> float:
+        """Interpreta o header Retry-After (apenas o formato em segundos).
+
+        Args:
+            value: Valor do header
+            default: Espera padrão quando o header está ausente ou inválido
 
-            # Detecta mensagem específica de falta de acesso da unidade
-            msg_lower = msg.lower()
-            if 'não possui acesso ao processo' in msg_lower or 'does not have access to process' in msg_lower:
-                return True
+        Returns:
+            Segundos de espera (limitado a 60s)
+        """
+        try:
+            return min(max(float(value), 0.0), 60.0)
+        except (TypeError, ValueError):
+            return default
 
-        return False
+    def _classify_error(self, error_data: Dict[str, Any]) -> SeiErrorKind:
+        """Classifica o erro retornado pela API em uma única passada.
 
-    def _is_permanent_error(self, error_data: Dict[str, Any]) -> bool:
-        """Verifica se o erro é permanente (não deve ser retentado em nenhuma unidade).
+        Erro de acesso da unidade tem precedência sobre erro permanente:
+        se qualquer mensagem indicar falta de acesso, outras unidades
+        ainda podem ter acesso ao processo.
+
+        Estrutura esperada: {"detail": [{"msg": "Processo [...] não encontrado.", ...}]}
 
         Args:
             error_data: Dados do erro retornado pela API
 
         Returns:
-            True se for erro permanente
+            SeiErrorKind correspondente
         """
         if not isinstance(error_data, dict):
-            return False
+            return SeiErrorKind.TRANSIENT
 
-        # Estrutura: {"detail": [{"msg": "Processo [...] não encontrado.", ...}]}
         detail = error_data.get('detail', [])
         if not isinstance(detail, list):
-            return False
+            return SeiErrorKind.TRANSIENT
 
+        is_permanent = False
         for error_item in detail:
             if not isinstance(error_item, dict):
                 continue
@@ -396,25 +495,14 @@ class SeiAPIClient:
             if not isinstance(msg, str):
                 continue
 
-            # Detecta mensagens de erro permanente (mas NÃO erro de acesso da unidade)
-            msg_lower = msg.lower()
-
-            # Se for erro de acesso da unidade, não é permanente
-            if 'não possui acesso ao processo' in msg_lower or 'does not have access to process' in msg_lower:
-                return False
-
-            # Detecta outros erros permanentes
-            permanent_patterns = [
-                'não encontrado',
-                'not found',
-                'não existe',
-                'does not exist'
-            ]
+            msg_folded = msg.casefold()
+            if any(pattern in msg_folded for pattern in self._ACCESS_PATTERNS):
+                return SeiErrorKind.ACCESS
 
-            if any(pattern in msg_lower for pattern in permanent_patterns):
-                return True
+            if not is_permanent:
+                is_permanent = any(pattern in msg_folded for pattern in self._PERMANENT_PATTERNS)
 
-        return False
+        return SeiErrorKind.PERMANENT if is_permanent else SeiErrorKind.TRANSIENT
 
     def _extract_error_message(self, error_data: Dict[str, Any]) -> str:
         """Extrai mensagem de erro da resposta da API.
@@ -468,90 +556,201 @@ class SeiAPIClient:
             "sinal_completo": "S"
         }
 
-        return await self._request("GET", endpoint, params=params)
+        cache_key = ('processo', id_unidade, protocolo, sin_retornar_atributos)
+        return await self._cached_request(cache_key, endpoint, params)
 
-    async def listar_documentos(
+    async def _cached_request(
+        self,
+        cache_key: Tuple[str, ...],
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """GET com cache LRU por instância para consultas repetidas.
+
+        Apenas respostas de sucesso são armazenadas; erros (ex: unidade sem
+        acesso) sempre vão à API. O dicionário retornado é compartilhado
+        entre chamadas e não deve ser modificado.
+
+        Args:
+            cache_key: Chave da consulta (tipo, unidade, protocolo, flags)
+            endpoint: Endpoint da API
+            params: Parâmetros da requisição
+
+        Returns:
+            Resposta JSON da API
+        """
+        cached = self._consulta_cache.get(cache_key)
+        if cached is not None:
+            self._consulta_cache.move_to_end(cache_key)
+            return cached
+
+        response = await self._request("GET", endpoint, params=params)
+
+        self._consulta_cache[cache_key] = response
+        if len(self._consulta_cache) > self._CONSULTA_CACHE_SIZE:
+            self._consulta_cache.popitem(last=False)
+        return response
+
+    async def _paged_gather(
+        self,
+        sources: List[Tuple[str, Dict[str, Any], int, str]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Busca as páginas 2..N de um ou mais endpoints com um pool fixo de workers.
+
+        Em vez de criar uma task por página, no máximo `max_concurrent`
+        workers consomem (fonte, página) de uma única fila compartilhada.
+        Páginas com erro são registradas e ignoradas; a ordem das páginas
+        é preservada dentro de cada fonte.
+
+        Args:
+            sources: Lista de (endpoint, params da primeira página,
+                total_paginas, chave da lista na resposta)
+
+        Returns:
+            Para cada fonte, os itens das páginas 2..total_paginas, em ordem
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for idx, (_, _, total_paginas, _) in enumerate(sources):
+            for pagina in range(2, total_paginas + 1):
+                queue.put_nowait((idx, pagina))
+
+        pages: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+
+        async def worker() -> None:
+            while True:
+                try:
+                    idx, pagina = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                endpoint, base_params, _, list_key = sources[idx]
+                params = {**base_params, "pagina": pagina}
+                try:
+                    # Só a lista importa nas páginas 2..N (Info já veio na primeira)
+                    pages[(idx, pagina)] = await self._request_raw(
+                        "GET", endpoint, decode=partial(self._extract_list, list_key=list_key), params=params
+                    )
+                except Exception as e:
+                    logger.error(f"Erro ao buscar página {pagina} de {list_key.lower()}: {e}")
+
+        num_workers = min(self.max_concurrent, queue.qsize())
+        await asyncio.gather(*(worker() for _ in range(num_workers)))
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in sources]
+        for idx, pagina in sorted(pages):
+            results[idx].extend(pages.pop((idx, pagina)))
+        return results
+
+    def _process_list_source(
         self,
+        list_key: str,
         id_unidade: str,
         protocolo_procedimento: str
-    ) -> List[Dict[str, Any]]:
-        """Lista documentos de um processo com paginação paralela.
+    ) -> Tuple[str, Dict[str, Any], str]:
+        """Monta a fonte paginada de uma lista do processo.
 
-        Primeira requisição obtém Info.TotalPaginas, depois busca
-        páginas restantes em paralelo (15 documentos por página).
+        Única definição de endpoint/parâmetros usada por `listar_documentos`,
+        `listar_andamentos` e `fetch_process_pages`.
 
         Args:
+            list_key: 'Documentos' ou 'Andamentos'
             id_unidade: ID da unidade
-            protocolo_procedimento: Protocolo do procedimento (ex: "00002.012471/2025-15")
+            protocolo_procedimento: Protocolo do procedimento
 
         Returns:
-            Lista completa de documentos
+            Tupla (endpoint, params da primeira página, list_key)
         """
-        endpoint = f"/v1/unidades/{id_unidade}/procedimentos/documentos"
-        itens_por_pagina = 200
-
-        # Primeira requisição para obter Info
+        path, extra_params = self._PROCESS_LISTS[list_key]
         params = {
             "protocolo_procedimento": protocolo_procedimento,
-            "sinal_completo": "S",
+            **extra_params,
             "pagina": 1,
-            "quantidade": itens_por_pagina
+            "quantidade": self._ITENS_POR_PAGINA,
         }
+        return f"/v1/unidades/{id_unidade}/procedimentos/{path}", params, list_key
 
-        logger.debug(f"Buscando documentos - unidade: {id_unidade}, protocolo: {protocolo_procedimento}")
+    @staticmethod
+    def _parse_first_page(response: Any, list_key: str) -> Tuple[List[Dict[str, Any]], int]:
+        """Extrai os itens e o total de páginas da primeira página.
 
-        try:
-            first_response = await self._request("GET", endpoint, params=params)
+        A API retorna a lista sob uma chave com inicial maiúscula e o total
+        em Info.TotalPaginas; a lista da resposta é devolvida sem cópia
+        para ser estendida in-place.
 
-            # Debug: mostra estrutura da resposta
-            if isinstance(first_response, dict):
-                logger.debug(f"Documentos response keys: {list(first_response.keys())}")
-                logger.debug(f"Documentos response: {str(first_response)[:200]}...")
-            else:
-                logger.debug(f"Documentos response type: {type(first_response)}, length: {len(first_response) if isinstance(first_response, list) else 'N/A'}")
+        Args:
+            response: Primeira página já decodificada
+            list_key: Chave da lista de itens (ex: 'Documentos')
+
+        Returns:
+            Tupla (itens da primeira página, total de páginas)
+        """
+        if isinstance(response, dict):
+            items = response.get(list_key, [])
+            info = response.get('Info', {})
+        else:
+            logger.debug("{} response type: {}", list_key, type(response))
+            items = response if isinstance(response, list) else []
+            info = {}
+
+        total_paginas = info.get('TotalPaginas', 1)
+        logger.debug("{}: {} itens em {} página(s)", list_key, info.get('TotalItens', len(items)), total_paginas)
+        return items, total_paginas
+
+    async def _list_paginated(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        list_key: str
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os itens de um endpoint paginado.
 
-            # Extrai documentos da primeira página (API retorna com 'D' maiúsculo)
-            first_docs = first_response if isinstance(first_response, list) else first_response.get('Documentos', [])
-            all_docs = list(first_docs)
+        Primeira requisição obtém Info.TotalPaginas, depois busca
+        páginas restantes em paralelo via `_paged_gather`.
 
-            # Extrai informações de paginação
-            info = first_response.get('Info', {}) if isinstance(first_response, dict) else {}
-            total_paginas = info.get('TotalPaginas', 1)
-            total_itens = info.get('TotalItens', len(first_docs))
+        Args:
+            endpoint: Endpoint paginado
+            params: Parâmetros da primeira página (com pagina/quantidade)
+            list_key: Chave da lista de itens na resposta (ex: 'Documentos')
 
-            logger.debug(f"Documentos: {total_itens} itens em {total_paginas} página(s)")
+        Returns:
+            Lista completa de itens (vazia em caso de erro)
+        """
+        label = list_key.lower()
+
+        try:
+            first_response = await self._request("GET", endpoint, params=params)
+            items, total_paginas = self._parse_first_page(first_response, list_key)
 
             # Se houver mais páginas, busca em paralelo
             if total_paginas > 1:
-                tasks = []
-                for pagina in range(2, total_paginas + 1):
-                    params = {
-                        "protocolo_procedimento": protocolo_procedimento,
-                        "sinal_completo": "S",
-                        "pagina": pagina,
-                        "quantidade": itens_por_pagina
-                    }
-                    tasks.append(self._request("GET", endpoint, params=params))
-
-                # Busca todas as páginas restantes em paralelo
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Consolida resultados
-                for pagina, resp in enumerate(responses, start=2):
-                    if isinstance(resp, Exception):
-                        logger.error(f"Erro ao buscar página {pagina} de documentos: {resp}")
-                        continue
-
-                    docs = resp if isinstance(resp, list) else resp.get('Documentos', [])
-                    all_docs.extend(docs)
-
-            logger.debug(f"Total de documentos coletados: {len(all_docs)}")
-            return all_docs
+                items.extend((await self._paged_gather([(endpoint, params, total_paginas, list_key)]))[0])
+
+            logger.debug("Total de {} coletados: {}", label, len(items))
+            return items
 
         except Exception as e:
-            logger.error(f"Erro ao listar documentos: {e}")
+            logger.error(f"Erro ao listar {label}: {e}")
             return []
 
+    async def listar_documentos(
+        self,
+        id_unidade: str,
+        protocolo_procedimento: str
+    ) -> List[Dict[str, Any]]:
+        """Lista documentos de um processo com paginação paralela.
+
+        Args:
+            id_unidade: ID da unidade
+            protocolo_procedimento: Protocolo do procedimento (ex: "00002.012471/2025-15")
+
+        Returns:
+            Lista completa de documentos
+        """
+        logger.debug("Buscando documentos - unidade: {}, protocolo: {}", id_unidade, protocolo_procedimento)
+        return await self._list_paginated(
+            *self._process_list_source('Documentos', id_unidade, protocolo_procedimento)
+        )
+
     async def listar_andamentos(
         self,
         id_unidade: str,
@@ -559,9 +758,6 @@ class SeiAPIClient:
     ) -> List[Dict[str, Any]]:
         """Lista andamentos de um processo com paginação paralela.
 
-        Primeira requisição obtém Info.TotalPaginas, depois busca
-        páginas restantes em paralelo (100 andamentos por página).
-
         Args:
             id_unidade: ID da unidade
             protocolo_procedimento: Protocolo do procedimento (ex: "00002.012471/2025-15")
@@ -569,70 +765,64 @@ class SeiAPIClient:
         Returns:
             Lista completa de andamentos
         """
-        endpoint = f"/v1/unidades/{id_unidade}/procedimentos/andamentos"
-        itens_por_pagina = 200
-
-        # Primeira requisição para obter Info
-        params = {
-            "protocolo_procedimento": protocolo_procedimento,
-            "sinal_atributos": "S",
-            "pagina": 1,
-            "quantidade": itens_por_pagina
-        }
+        logger.debug("Buscando andamentos - unidade: {}, protocolo: {}", id_unidade, protocolo_procedimento)
+        return await self._list_paginated(
+            *self._process_list_source('Andamentos', id_unidade, protocolo_procedimento)
+        )
 
-        logger.debug(f"Buscando andamentos - unidade: {id_unidade}, protocolo: {protocolo_procedimento}")
+    async def fetch_process_pages(
+        self,
+        id_unidade: str,
+        protocolo_procedimento: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Lista documentos e andamentos de um processo num único pool.
 
-        try:
-            first_response = await self._request("GET", endpoint, params=params)
+        As primeiras páginas dos dois endpoints são buscadas em paralelo;
+        as páginas restantes de ambos são distribuídas no mesmo pool de
+        workers de `_paged_gather`. Erros são tratados como em
+        `listar_documentos`/`listar_andamentos` (lista vazia).
 
-            # Debug: mostra estrutura da resposta
-            if isinstance(first_response, dict):
-                logger.debug(f"Andamentos response keys: {list(first_response.keys())}")
-                logger.debug(f"Andamentos response: {str(first_response)[:200]}...")
-            else:
-                logger.debug(f"Andamentos response type: {type(first_response)}, length: {len(first_response) if isinstance(first_response, list) else 'N/A'}")
+        Args:
+            id_unidade: ID da unidade
+            protocolo_procedimento: Protocolo do procedimento
 
-            # Extrai andamentos da primeira página (API retorna com 'A' maiúsculo)
-            first_andamentos = first_response if isinstance(first_response, list) else first_response.get('Andamentos', [])
-            all_andamentos = list(first_andamentos)
+        Returns:
+            Tupla (documentos, andamentos)
+        """
+        sources = [
+            self._process_list_source(list_key, id_unidade, protocolo_procedimento)
+            for list_key in ('Documentos', 'Andamentos')
+        ]
 
-            # Extrai informações de paginação
-            info = first_response.get('Info', {}) if isinstance(first_response, dict) else {}
-            total_paginas = info.get('TotalPaginas', 1)
-            total_itens = info.get('TotalItens', len(first_andamentos))
+        first_responses = await asyncio.gather(
+            *(self._request("GET", endpoint, params=params) for endpoint, params, _ in sources),
+            return_exceptions=True
+        )
 
-            logger.debug(f"Andamentos: {total_itens} itens em {total_paginas} página(s)")
+        results: List[List[Dict[str, Any]]] = []
+        remaining: List[Tuple[str, Dict[str, Any], int, str]] = []
+        remaining_idx: List[int] = []
+        for idx, ((endpoint, params, list_key), resp) in enumerate(zip(sources, first_responses)):
+            if isinstance(resp, Exception):
+                logger.error(f"Erro ao listar {list_key.lower()}: {resp}")
+                results.append([])
+                continue
 
-            # Se houver mais páginas, busca em paralelo
+            items, total_paginas = self._parse_first_page(resp, list_key)
+            results.append(items)
             if total_paginas > 1:
-                tasks = []
-                for pagina in range(2, total_paginas + 1):
-                    params = {
-                        "protocolo_procedimento": protocolo_procedimento,
-                        "sinal_atributos": "S",
-                        "pagina": pagina,
-                        "quantidade": itens_por_pagina
-                    }
-                    tasks.append(self._request("GET", endpoint, params=params))
-
-                # Busca todas as páginas restantes em paralelo
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Consolida resultados
-                for pagina, resp in enumerate(responses, start=2):
-                    if isinstance(resp, Exception):
-                        logger.error(f"Erro ao buscar página {pagina} de andamentos: {resp}")
-                        continue
-
-                    andamentos = resp if isinstance(resp, list) else resp.get('Andamentos', [])
-                    all_andamentos.extend(andamentos)
-
-            logger.debug(f"Total de andamentos coletados: {len(all_andamentos)}")
-            return all_andamentos
+                remaining.append((endpoint, params, total_paginas, list_key))
+                remaining_idx.append(idx)
 
-        except Exception as e:
-            logger.error(f"Erro ao listar andamentos: {e}")
-            return []
+        if remaining:
+            for idx, items in zip(remaining_idx, await self._paged_gather(remaining)):
+                results[idx].extend(items)
+
+        logger.debug(
+            "Processo {}: {} documentos, {} andamentos",
+            protocolo_procedimento, len(results[0]), len(results[1])
+        )
+        return results[0], results[1]
 
     async def consultar_documento(
         self,
@@ -657,51 +847,87 @@ class SeiAPIClient:
             "sinal_completo": "S"
         }
 
-        return await self._request("GET", endpoint, params=params)
+        cache_key = ('documento', id_unidade, protocolo_documento, sin_retornar_geracao)
+        return await self._cached_request(cache_key, endpoint, params)
 
-    async def baixar_documento(
+    async def baixar_documento_stream(
         self,
         id_unidade: str,
         protocolo_documento: str,
-        return_headers: bool = False
-    ) -> bytes | tuple[bytes, dict]:
-        """Baixa conteúdo binário de um documento.
+        response_headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536
+    ) -> AsyncIterator[bytes]:
+        """Baixa um documento em blocos, sem manter o conteúdo inteiro em memória.
+
+        O slot do semáforo fica reservado enquanto o gerador é consumido.
 
         Args:
             id_unidade: ID da unidade
             protocolo_documento: Protocolo do documento
-            return_headers: Se True, retorna tupla (content, headers)
+            response_headers: Se informado, é preenchido com os headers da
+                resposta (incluindo content-disposition) antes do primeiro bloco
+            chunk_size: Tamanho de cada bloco em bytes
 
-        Returns:
-            Conteúdo binário do documento, ou tupla (content, headers) se return_headers=True
+        Yields:
+            Blocos do conteúdo binário do documento
         """
-        async with self.semaphore:
-            token = await self._get_token()
+        async with self.semaphore, self.limiter:
+            token = self._token_if_fresh() or await self._get_token()
 
             endpoint = f"/v1/unidades/{id_unidade}/documentos/baixar"
             url = f"{self.base_url}{endpoint}"
             params = {"protocolo_documento": protocolo_documento}
             headers = {'token': token}
 
-            logger.debug(f"Baixando documento {protocolo_documento}")
+            logger.debug("Baixando documento {}", protocolo_documento)
 
             try:
-                async with self._session.get(url, params=params, headers=headers) as response:
+                async with self._session.get(
+                    url, params=params, headers=headers, timeout=self.download_timeout
+                ) as response:
                     response.raise_for_status()
-                    content = await response.read()
-                    logger.success(f"Documento baixado: {len(content)} bytes")
 
-                    if return_headers:
-                        # Retorna conteúdo e headers (incluindo content-disposition)
-                        response_headers = dict(response.headers)
-                        return content, response_headers
-                    else:
-                        return content
+                    if response_headers is not None:
+                        response_headers.update(response.headers)
+
+                    total = 0
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        total += len(chunk)
+                        yield chunk
+
+                    logger.success(f"Documento baixado: {total} bytes")
 
             except aiohttp.ClientError as e:
                 logger.error(f"Erro ao baixar documento {protocolo_documento}: {e}")
                 raise
 
+    async def baixar_documento(
+        self,
+        id_unidade: str,
+        protocolo_documento: str,
+        return_headers: bool = False
+    ) -> bytes | tuple[bytes, dict]:
+        """Baixa conteúdo binário de um documento.
+
+        Args:
+            id_unidade: ID da unidade
+            protocolo_documento: Protocolo do documento
+            return_headers: Se True, retorna tupla (content, headers)
+
+        Returns:
+            Conteúdo binário do documento, ou tupla (content, headers) se return_headers=True
+        """
+        response_headers: Dict[str, str] = {}
+        content = b"".join([
+            chunk async for chunk in
+            self.baixar_documento_stream(id_unidade, protocolo_documento, response_headers)
+        ])
+
+        if return_headers:
+            # Retorna conteúdo e headers (incluindo content-disposition)
+            return content, response_headers
+        return content
+
     async def listar_unidades(self, id_tipo_procedimento: Optional[str] = None) -> List[Dict[str, Any]]:
         """Lista unidades disponíveis.
 
@@ -1,4 +1,5 @@
 """Configurações do projeto usando Pydantic Settings."""
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -47,6 +48,10 @@ class Settings(BaseSettings):
     batch_size: int = Field(default=1000, description="Tamanho do batch para extração")
     max_workers: int = Field(default=4, description="Número máximo de workers")
 
+    # Pool de conexões (por engine; vale para SEI e local)
+    db_pool_size: int = Field(default=10, description="Conexões mantidas no pool de cada engine")
+    db_max_overflow: int = Field(default=20, description="Conexões extras permitidas além do pool")
+
     # API SEI (Consulta via API REST)
     sei_api_base_url: str = Field(default="https://api.sei.pi.gov.br", description="URL base da API SEI")
     sei_api_user: str = Field(..., description="Usuário da API SEI")
@@ -57,7 +62,7 @@ class Settings(BaseSettings):
     sei_api_max_concurrent_downloads: int = Field(default=5, description="Máximo de downloads simultâneos")
     sei_api_timeout: int = Field(default=30, description="Timeout em segundos")
 
-    @property
+    @cached_property
     def sei_db_url(self) -> str:
         """URL de conexão do banco SEI."""
         return (
@@ -65,7 +70,7 @@ class Settings(BaseSettings):
             f"@{self.sei_db_host}:{self.sei_db_port}/{self.sei_db_name}"
         )
 
-    @property
+    @cached_property
     def local_db_url(self) -> str:
         """URL de conexão do banco local."""
         return (
@@ -73,7 +78,17 @@ class Settings(BaseSettings):
             f"@{self.local_db_host}:{self.local_db_port}/{self.local_db_name}"
         )
 
-    @property
+    @cached_property
+    def sei_db_async_url(self) -> str:
+        """URL de conexão assíncrona (asyncpg) do banco SEI."""
+        return self.sei_db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    @cached_property
+    def local_db_async_url(self) -> str:
+        """URL de conexão assíncrona (asyncpg) do banco local."""
+        return self.local_db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    @cached_property
     def redis_url(self) -> str:
         """URL de conexão do Redis."""
         return f"redis://{self.redis_host}:{self.redis_port}"
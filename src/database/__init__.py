@@ -2,6 +2,8 @@
 from .base import ORMBase as Base
 from .base import ExtDeclarativeBase
 from .session import get_sei_engine, get_local_engine, get_sei_session, get_local_session
+from .session import get_async_sei_engine, get_async_local_engine, get_async_sei_session, get_async_local_session
+from .bulk import bulk_insert, bulk_upsert
 
 __all__ = [
     'Base',
@@ -10,4 +12,10 @@ __all__ = [
     'get_local_engine',
     'get_sei_session',
     'get_local_session',
+    'get_async_sei_engine',
+    'get_async_local_engine',
+    'get_async_sei_session',
+    'get_async_local_session',
+    'bulk_insert',
+    'bulk_upsert',
 ]
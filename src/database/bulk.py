@@ -0,0 +1,193 @@
+"""Helpers de escrita em lote para as tabelas do ETL."""
+import csv
+import io
+from itertools import islice
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Sequence
+
+from sqlalchemy import Table, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+
+def _chunked(rows: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Divide um iterável de linhas em listas de no máximo chunk_size itens."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def bulk_insert(
+    session: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    chunk_size: int = 1000
+) -> int:
+    """Insere linhas em lote via Core INSERT (sem instanciar objetos ORM).
+
+    Cada bloco vira um único executemany; com psycopg2 o SQLAlchemy
+    agrupa as linhas em INSERTs multi-VALUES (insertmanyvalues). O
+    iterável é consumido em blocos, mantendo a memória limitada.
+
+    Args:
+        session: Sessão ativa (commit fica a cargo de quem chama)
+        model: Modelo ORM de destino (ex: SeiAndamento)
+        rows: Dicionários coluna -> valor
+        chunk_size: Linhas por executemany
+
+    Returns:
+        Total de linhas inseridas
+    """
+    stmt = insert(model)
+    total = 0
+    for chunk in _chunked(rows, chunk_size):
+        session.execute(stmt, chunk)
+        total += len(chunk)
+    return total
+
+
+def bulk_upsert(
+    session: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    index_elements: Sequence[str],
+    update_exclude: Collection[str] = (),
+    chunk_size: int = 1000
+) -> int:
+    """Upsert em lote via INSERT ... ON CONFLICT DO UPDATE (PostgreSQL).
+
+    Substitui o padrão SELECT + add/update por linha: o conflito é resolvido
+    no servidor pelo índice único, e cada bloco vai num único executemany.
+    Linhas repetidas para a mesma chave são reduzidas à última ocorrência,
+    já que um mesmo comando não pode atualizar a mesma linha duas vezes.
+
+    Args:
+        session: Sessão ou conexão ativa (commit fica a cargo de quem chama)
+        model: Modelo ORM de destino (ex: SeiDocumento)
+        rows: Dicionários coluna -> valor, todos com as mesmas chaves
+        index_elements: Colunas do índice único usado no ON CONFLICT
+        update_exclude: Colunas que não devem ser sobrescritas no UPDATE
+        chunk_size: Linhas por executemany
+
+    Returns:
+        Total de linhas inseridas ou atualizadas
+    """
+    unique_rows = list({tuple(row[col] for col in index_elements): row for row in rows}.values())
+    if not unique_rows:
+        return 0
+
+    stmt = pg_insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={
+            col: stmt.excluded[col]
+            for col in unique_rows[0]
+            if col not in index_elements and col not in update_exclude
+        }
+    )
+    total = 0
+    for chunk in _chunked(unique_rows, chunk_size):
+        session.execute(stmt, chunk)
+        total += len(chunk)
+    return total
+
+
+def bulk_copy(
+    engine: Engine,
+    table: Table,
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str]
+) -> int:
+    """Carrega linhas via COPY FROM STDIN (PostgreSQL), com fallback para INSERT.
+
+    As linhas são serializadas em CSV (valores None viram NULL) num buffer
+    em memória e enviadas num único COPY, em uma transação própria. Em
+    outros dialetos usa `insert()` executemany em blocos.
+
+    Args:
+        engine: Engine de destino
+        table: Tabela de destino (ex: SeiProcessoTempETL.__table__)
+        rows: Tuplas de valores na mesma ordem de `columns`
+        columns: Nomes das colunas a carregar
+
+    Returns:
+        Total de linhas carregadas
+    """
+    if engine.dialect.name != 'postgresql':
+        total = 0
+        with engine.begin() as conn:
+            for chunk in _chunked((dict(zip(columns, row)) for row in rows), 1000):
+                conn.execute(insert(table), chunk)
+                total += len(chunk)
+        return total
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    total = 0
+    for row in rows:
+        writer.writerow(['\\N' if value is None else value for value in row])
+        total += 1
+
+    if not total:
+        return 0
+    buffer.seek(0)
+
+    preparer = engine.dialect.identifier_preparer
+    copy_sql = (
+        f"COPY {preparer.format_table(table)} "
+        f"({', '.join(preparer.quote(col) for col in columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+
+    raw_conn = engine.raw_connection()
+    try:
+        with raw_conn.cursor() as cursor:
+            cursor.copy_expert(copy_sql, buffer)
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+    return total
+
+
+async def bulk_copy_async(
+    engine: AsyncEngine,
+    table: Table,
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str]
+) -> int:
+    """Carrega linhas via COPY binário do asyncpg (`copy_records_to_table`).
+
+    Os valores seguem como objetos Python nativos (str, int, datetime) e o
+    driver os codifica no formato binário do COPY: sem serialização em texto
+    no cliente nem parsing de texto no servidor. O COPY roda fora de
+    transação explícita (autocommit), como uma carga atômica.
+
+    Args:
+        engine: Engine assíncrono (asyncpg) de destino
+        table: Tabela de destino (ex: SeiProcessoTempETL.__table__)
+        rows: Tuplas de valores na mesma ordem de `columns`, com os tipos
+            Python das colunas (asyncpg não converte str -> timestamp)
+        columns: Nomes das colunas a carregar
+
+    Returns:
+        Total de linhas carregadas
+    """
+    records = rows if isinstance(rows, list) else list(rows)
+    if not records:
+        return 0
+
+    async with engine.connect() as conn:
+        raw_conn = await conn.get_raw_connection()
+        await raw_conn.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=list(columns),
+            schema_name=table.schema,
+        )
+
+    return len(records)
@@ -3,16 +3,30 @@
 IMPORTANTE: Apenas modelos que devem ser criados no banco LOCAL.
 Modelos para leitura do banco SEI estão em declarative_models.py
 """
-from sqlalchemy import Column, String, DateTime, Integer, BigInteger, Text, Boolean, JSON
-from sqlalchemy import ForeignKey, Index
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Integer, BigInteger, Text, Boolean, Enum
+from sqlalchemy import DDL, ForeignKey, Index, event, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 from ..base import ORMBase
 
+# Timestamps preenchidos pelo PostgreSQL, em UTC sem timezone (mesma semântica
+# do antigo default=datetime.utcnow, sem chamada Python por linha)
+utc_now = func.timezone('utc', func.now())
+
+# Estados como ENUM nativo do PostgreSQL (4 bytes por valor, em vez de varchar)
+ETLStatus = Enum(
+    'pending', 'processing', 'completed', 'error', 'not_found', 'access_denied',
+    name='etl_status'
+)
+DocumentoStatus = Enum('pending', 'downloading', 'completed', 'error', name='documento_status')
+
 # -------------------- TABELAS DE ETL --------------------
 class SeiProcessoTempETL(ORMBase):
     """Modelo para tabela temporária de processos no banco local (destino)."""
     __tablename__ = 'sei_processos_temp_etl'
+    # Staging recriada a cada extração: UNLOGGED dispensa WAL no COPY (o
+    # conteúdo é perdido em crash recovery, o que é aceitável aqui)
+    __table_args__ = {'prefixes': ['UNLOGGED']}
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     protocol = Column(String(50), nullable=False, index=True)
@@ -20,7 +34,7 @@ class SeiProcessoTempETL(ORMBase):
     data_hora = Column(DateTime, nullable=False)
     tipo_procedimento = Column(String(255))
     unidade = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
 
     def __repr__(self):
         return f"<SeiProcessoTempETL(protocol={self.protocol}, id_protocolo={self.id_protocolo})>"
@@ -29,21 +43,32 @@ class SeiETLStatus(ORMBase):
     """Controle de estado da pipeline ETL."""
 
     __tablename__ = 'sei_etl_status'
+    __table_args__ = (
+        # Busca por status (+ agendamento de retry); INCLUDE permite index-only
+        # scan nas subconsultas "protocolos já consultados"
+        Index('ix_sei_etl_status_metadata_retry', 'metadata_status', 'next_retry_at',
+              postgresql_include=['protocol']),
+        # Fila de pendências de documentos/andamentos (índices parciais)
+        Index('ix_sei_etl_status_documentos_pending', 'documentos_status', 'next_retry_at',
+              postgresql_where=text("documentos_status = 'pending'")),
+        Index('ix_sei_etl_status_andamentos_pending', 'andamentos_status', 'next_retry_at',
+              postgresql_where=text("andamentos_status = 'pending'")),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     protocol = Column(String(50), unique=True, nullable=False, index=True)
 
     # Status de cada etapa
-    metadata_status = Column(String(50), default='pending', index=True)  # pending, processing, completed, error
+    metadata_status = Column(ETLStatus, default='pending')  # pending, processing, completed, error, not_found, access_denied
     metadata_fetched_at = Column(DateTime)
     metadata_error = Column(Text)
 
-    documentos_status = Column(String(50), default='pending', index=True)
+    documentos_status = Column(ETLStatus, default='pending')
     documentos_total = Column(Integer, default=0)
     documentos_downloaded = Column(Integer, default=0)
     documentos_error = Column(Text)
 
-    andamentos_status = Column(String(50), default='pending', index=True)
+    andamentos_status = Column(ETLStatus, default='pending')
     andamentos_total = Column(Integer, default=0)
     andamentos_error = Column(Text)
 
@@ -53,8 +78,8 @@ class SeiETLStatus(ORMBase):
     next_retry_at = Column(DateTime)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
         return f"<SeiETLStatus(protocol={self.protocol}, metadata={self.metadata_status}, docs={self.documentos_status})>"
@@ -81,8 +106,8 @@ class SeiOrgao(ORMBase):
     id = Column(Integer, primary_key=True, autoincrement=True)
     nome_orgao = Column(String(255), nullable=False)
     sigla_orgao = Column(String(50))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
         return f"<SeiOrgao(nome={self.sigla_orgao})>"
@@ -96,13 +121,12 @@ class SeiUnidade(ORMBase):
     sigla_unidade = Column(String(50))
     nome_unidade = Column(String(255), nullable=False)
     nivel_unidade = Column(Integer)
-    id_orgao = Column(Integer, ForeignKey('sei_orgaos.id'))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-)
+    id_orgao = Column(Integer, ForeignKey('sei_orgaos.id', ondelete='CASCADE'), index=True)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
-        return f"<SeiUnidade(sei_id_unidade={self.sei_id_unidade}, nome={self.nome_unidade})>"
+        return f"<SeiUnidade(id_sei_unidade={self.id_sei_unidade}, nome={self.nome_unidade})>"
 
 # -------------------- METADADOS DE PROCESSOS --------------------
 class SeiAssuntoProcesso(ORMBase):
@@ -112,11 +136,11 @@ class SeiAssuntoProcesso(ORMBase):
     id = Column(Integer, primary_key=True, autoincrement=True)
     descricao_assunto = Column(String(255), nullable=False, index=True)
     codigo_sei_assunto = Column(String(50), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
-        return f"<SeiAssuntoProcesso(nome={self.nome_assunto})>"
+        return f"<SeiAssuntoProcesso(nome={self.descricao_assunto})>"
 
 class SeiTipoProcesso(ORMBase):
     """Modelo para tipos de processos SEI no banco local (destino)."""
@@ -124,11 +148,11 @@ class SeiTipoProcesso(ORMBase):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     descricao_tipo = Column(String(255), nullable=False, index=True, unique=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
-        return f"<SeiTipoProcesso(nome={self.nome_tipo})>"
+        return f"<SeiTipoProcesso(nome={self.descricao_tipo})>"
 
 class SeiProcessoStatus(ORMBase):
     """Modelo para status de processos SEI no banco local (destino)."""
@@ -136,11 +160,11 @@ class SeiProcessoStatus(ORMBase):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     descricao_status = Column(String(255), nullable=False, index=True, unique=True) # Aberto, Pausado, Concluído
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
-        return f"<SeiProcessoStatus(nome={self.nome_status})>"
+        return f"<SeiProcessoStatus(nome={self.descricao_status})>"
 
 class SeiProcesso(ORMBase):
     """Metadados completos dos processos consultados via API SEI."""
@@ -148,7 +172,7 @@ class SeiProcesso(ORMBase):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     protocol = Column(String(50), unique=True, nullable=False, index=True)
-    id_protocolo = Column(BigInteger, index=True)
+    id_protocolo = Column(BigInteger)
     id_unidade = Column(Integer)
 
     # Metadados básicos
@@ -163,19 +187,20 @@ class SeiProcesso(ORMBase):
     data_conclusao = Column(DateTime)
 
     # Arrays JSON
-    interessados = Column(JSON)  # Array de interessados
-    assuntos = Column(JSON)  # Array de assuntos
+    interessados = Column(JSONB)  # Array de interessados
+    assuntos = Column(JSONB)  # Array de assuntos
 
     # Unidades
     unidade_geradora = Column(String(255))
     unidade_atual = Column(String(255))
 
     # Auditoria e dados brutos
-    raw_api_response = Column(JSON)  # Resposta completa da API (para auditoria/debug)
+    # Resposta completa da API (para auditoria/debug); carregada sob demanda (deferred)
+    raw_api_response = deferred(Column(JSONB))
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
     fetched_at = Column(DateTime)  # Quando foi consultado na API
 
     # Relationships
@@ -196,7 +221,7 @@ class SeiD0ProcessoUnidadeAberta(ORMBase):
     id_sei_protocolo = Column(BigInteger, index=True, unique=True, nullable=False)
     id_usuario_atribuidor = Column(BigInteger, index=True)  # Pessoa fisica atribuida
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
 
     def __repr__(self):
         return f"<SeiD0ProcessoUnidadeAberta(unidade={self.id_sei_unidade}, protocolo={self.protocolo_formatado})>"
@@ -210,19 +235,29 @@ class SeiDocumentoTipo(ORMBase):
     id_sei_serie = Column(Integer, unique=True, nullable=False, index=True)
     descricao_tipo = Column(String(255), nullable=False, index=True, unique=True)
     aplicabilidade = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
-        return f"<SeiDocumentoTipo(nome={self.nome_tipo})>"
+        return f"<SeiDocumentoTipo(nome={self.descricao_tipo})>"
 
 class SeiDocumento(ORMBase):
     """Documentos de cada processo."""
     __tablename__ = 'sei_documentos'
+    __table_args__ = (
+        # Documentos de um processo por status (também serve a FK processo_id)
+        Index('ix_sei_documentos_processo_status', 'processo_id', 'status'),
+        # Contagens por protocolo/status na finalização do ETL
+        Index('ix_sei_documentos_protocol_status', 'protocol', 'status'),
+        # Fila de download: pendentes em ordem de criação; id desempata e
+        # serve o keyset (created_at, id) da reserva de lotes
+        Index('ix_sei_documentos_pending', 'created_at', 'id',
+              postgresql_where=text("status = 'pending'")),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    processo_id = Column(Integer, ForeignKey('sei_processos.id'), nullable=False, index=True)
-    protocol = Column(String(50), nullable=False, index=True)
+    processo_id = Column(Integer, ForeignKey('sei_processos.id'), nullable=False)
+    protocol = Column(String(50), nullable=False)
 
     # Identificação do documento
     id_documento = Column(BigInteger, unique=True, nullable=False, index=True)
@@ -238,7 +273,7 @@ class SeiDocumento(ORMBase):
     usuario_gerador = Column(String(255))
     unidade_geradora = Column(String(255))
     assinado = Column(Boolean, default=False)
-    assinantes = Column(JSON)  # Array de assinantes
+    assinantes = deferred(Column(JSONB))  # Array de assinantes
 
     # Acesso
     nivel_acesso = Column(String(50))
@@ -252,17 +287,17 @@ class SeiDocumento(ORMBase):
     download_url = Column(Text)
 
     # Status de download
-    status = Column(String(50), default='pending', index=True)  # pending, downloading, completed, error
+    status = Column(DocumentoStatus, default='pending')  # pending, downloading, completed, error
     download_attempts = Column(Integer, default=0)
-    last_error = Column(Text)
+    last_error = deferred(Column(Text))
 
-    # Auditoria
-    raw_api_response = Column(JSON)
+    # Auditoria (carregada sob demanda)
+    raw_api_response = deferred(Column(JSONB))
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
     downloaded_at = Column(DateTime)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     # Relationship
     processo = relationship("SeiProcesso", back_populates="documentos")
@@ -275,9 +310,13 @@ class SeiAndamento(ORMBase):
     """Andamentos/atividades dos processos."""
 
     __tablename__ = 'sei_andamentos'
+    # Particionada por HASH(processo_id) em ANDAMENTOS_PARTITIONS partições
+    # (criadas no after_create abaixo / na migration); a chave de partição
+    # precisa fazer parte da PK.
+    __table_args__ = {'postgresql_partition_by': 'HASH (processo_id)'}
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    processo_id = Column(Integer, ForeignKey('sei_processos.id'), nullable=False, index=True)
+    processo_id = Column(Integer, ForeignKey('sei_processos.id'), primary_key=True, index=True)
     protocol = Column(String(50), nullable=False, index=True)
 
     # Identificação
@@ -298,13 +337,13 @@ class SeiAndamento(ORMBase):
     data_hora = Column(DateTime, index=True)
 
     # Atributos adicionais
-    atributos = Column(JSON)
+    atributos = Column(JSONB)
 
-    # Resposta completa da API
-    raw_api_response = Column(JSON)
+    # Resposta completa da API (carregada sob demanda)
+    raw_api_response = deferred(Column(JSONB))
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now, nullable=False)
 
     # Relationship
     processo = relationship("SeiProcesso", back_populates="andamentos")
@@ -312,6 +351,18 @@ class SeiAndamento(ORMBase):
     def __repr__(self):
         return f"<SeiAndamento(id_and={self.id_andamento}, tipo={self.tipo_andamento})>"
 
+ANDAMENTOS_PARTITIONS = 16
+
+for _remainder in range(ANDAMENTOS_PARTITIONS):
+    event.listen(
+        SeiAndamento.__table__,
+        'after_create',
+        DDL(
+            f"CREATE TABLE sei_andamentos_p{_remainder} PARTITION OF sei_andamentos "
+            f"FOR VALUES WITH (MODULUS {ANDAMENTOS_PARTITIONS}, REMAINDER {_remainder})"
+        ).execute_if(dialect='postgresql')
+    )
+
 # -------------------- CONSOLIDAÇÕES --------------------
 class SeiConsolidadoUnidade(ORMBase):
     """Modelo para consolidado de processos por unidade no banco local (destino)."""
@@ -325,7 +376,7 @@ class SeiConsolidadoUnidade(ORMBase):
     total_documentos = Column(Integer, default=0)
     total_andamentos = Column(Integer, default=0)
 
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
 
     def __repr__(self):
         return f"<seiConsolidadoUnidade(unidade={self.id_sei_unidade}, abertos={self.total_processos_abertos})>"
@@ -347,7 +398,7 @@ class SeiConsolidadoCGFR(ORMBase):
     foi_recebido_cgfr_sead = Column(Boolean, default=False, index=True)
     dt_recebido_cgfr_sead = Column(DateTime)
 
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now, nullable=False)
     def __repr__(self):
         return f"<SeiConsolidadoCGFR(protocol={self.sei_protocolo_formatado}, unidade={self.id_sei_unidade})>"
 
@@ -1,56 +1,81 @@
 """Gerenciamento de sessões e engines do SQLAlchemy."""
+from functools import lru_cache
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
 from src.config import settings
 
 
-# Engines
-_sei_engine = None
-_local_engine = None
+# Parâmetros de pool comuns aos dois bancos.
+# LIFO reaproveita as conexões mais "quentes" e deixa as excedentes ociosas
+# expirarem; recycle evita conexões derrubadas por timeout do servidor/proxy.
+# Tamanho configurável (settings.db_pool_size / db_max_overflow) para
+# acompanhar extrações paralelas (--workers).
+_POOL_OPTIONS = dict(
+    pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_use_lifo=True,
+    pool_recycle=3600,
+    pool_reset_on_return='rollback',
+)
 
+# Máximo de conexões simultâneas de cada engine (pool + overflow): acima
+# disso o checkout bloqueia até pool_timeout e falha.
+POOL_MAX_CONNECTIONS = _POOL_OPTIONS['pool_size'] + _POOL_OPTIONS['max_overflow']
 
+# Fast execution helpers do psycopg2: INSERTs em lote viram multi-VALUES
+# (insertmanyvalues) e UPDATE/DELETE executemany usam execute_batch.
+_EXECUTEMANY_OPTIONS = dict(
+    executemany_mode='values_plus_batch',
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
+
+
+# Engines (lru_cache garante inicialização única e thread-safe)
+@lru_cache(maxsize=1)
 def get_sei_engine():
     """Obtém engine do banco SEI (origem)."""
-    global _sei_engine
-    if _sei_engine is None:
-        _sei_engine = create_engine(
-            settings.sei_db_url,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-            echo=False,
-        )
-    return _sei_engine
+    return create_engine(
+        settings.sei_db_url,
+        echo=False,
+        **_POOL_OPTIONS,
+        **_EXECUTEMANY_OPTIONS,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_local_engine():
     """Obtém engine do banco local (destino)."""
-    global _local_engine
-    if _local_engine is None:
-        _local_engine = create_engine(
-            settings.local_db_url,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-            echo=False,
-        )
-    return _local_engine
+    return create_engine(
+        settings.local_db_url,
+        echo=False,
+        **_POOL_OPTIONS,
+        **_EXECUTEMANY_OPTIONS,
+    )
+
+
+# Session makers (vinculados uma única vez ao engine correspondente).
+# expire_on_commit=False: objetos continuam utilizáveis após cada commit
+# de batch sem disparar um novo SELECT por atributo acessado.
+@lru_cache(maxsize=1)
+def _sei_sessionmaker() -> sessionmaker:
+    return sessionmaker(bind=get_sei_engine(), autocommit=False, autoflush=False, expire_on_commit=False)
 
 
-# Session makers
-SeiSessionLocal = sessionmaker(autocommit=False, autoflush=False)
-LocalSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+@lru_cache(maxsize=1)
+def _local_sessionmaker() -> sessionmaker:
+    return sessionmaker(bind=get_local_engine(), autocommit=False, autoflush=False, expire_on_commit=False)
 
 
 @contextmanager
 def get_sei_session() -> Generator[Session, None, None]:
     """Context manager para sessão do banco SEI."""
-    engine = get_sei_engine()
-    SeiSessionLocal.configure(bind=engine)
-    session = SeiSessionLocal()
+    session = _sei_sessionmaker()()
     try:
         yield session
         session.commit()
@@ -64,9 +89,7 @@ def get_sei_session() -> Generator[Session, None, None]:
 @contextmanager
 def get_local_session() -> Generator[Session, None, None]:
     """Context manager para sessão do banco local."""
-    engine = get_local_engine()
-    LocalSessionLocal.configure(bind=engine)
-    session = LocalSessionLocal()
+    session = _local_sessionmaker()()
     try:
         yield session
         session.commit()
@@ -75,3 +98,51 @@ def get_local_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+# Engines assíncronos (asyncpg) para caminhos de leitura intensiva; os
+# engines síncronos continuam sendo usados por migrations e demais scripts.
+@lru_cache(maxsize=1)
+def get_async_sei_engine() -> AsyncEngine:
+    """Obtém engine assíncrono (asyncpg) do banco SEI (origem)."""
+    return create_async_engine(settings.sei_db_async_url, echo=False, **_POOL_OPTIONS)
+
+
+@lru_cache(maxsize=1)
+def get_async_local_engine() -> AsyncEngine:
+    """Obtém engine assíncrono (asyncpg) do banco local (destino)."""
+    return create_async_engine(settings.local_db_async_url, echo=False, **_POOL_OPTIONS)
+
+
+@lru_cache(maxsize=1)
+def _async_sei_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(bind=get_async_sei_engine(), autoflush=False, expire_on_commit=False)
+
+
+@lru_cache(maxsize=1)
+def _async_local_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(bind=get_async_local_engine(), autoflush=False, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def get_async_sei_session() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager assíncrono para sessão do banco SEI."""
+    async with _async_sei_sessionmaker()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+@asynccontextmanager
+async def get_async_local_session() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager assíncrono para sessão do banco local."""
+    async with _async_local_sessionmaker()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
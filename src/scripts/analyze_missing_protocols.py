@@ -1,45 +1,50 @@
 import pandas as pd
 
+# Use the PyArrow CSV reader (multithreaded, Arrow-backed strings) when available
+try:
+    import pyarrow  # noqa: F401
+    CSV_READER_OPTIONS = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+except ImportError:
+    CSV_READER_OPTIONS = {}
+
 # Read both CSV files (with error handling for malformed lines)
-consolidado_df = pd.read_csv('data/consolidado_cgfr.csv')
-processos_df = pd.read_csv('data/processos-cgfr.csv', on_bad_lines='skip')
+consolidado_df = pd.read_csv('data/consolidado_cgfr.csv', usecols=['protocol'], dtype={'protocol': 'string'}, **CSV_READER_OPTIONS)
+processos_df = pd.read_csv('data/processos-cgfr.csv', on_bad_lines='skip', dtype={'processo_formatado': 'string'}, **CSV_READER_OPTIONS)
 
 # Extract protocols from both dataframes
-consolidado_protocols = set(consolidado_df['protocol'].dropna())
-processos_protocols = set(processos_df['processo_formatado'].dropna())
+consolidado_protocols = frozenset(consolidado_df['protocol'].dropna())
+proc_series = processos_df['processo_formatado']
+processos_protocols = frozenset(proc_series.dropna())
 
 # Find protocols in processos_cgfr that are NOT in consolidado_cgfr
 missing_protocols = processos_protocols - consolidado_protocols
 
 # Filter for 2025 protocols (assuming the format is like 00002.000092/2025-74)
-missing_2025 = [p for p in missing_protocols if '/2025-' in str(p)]
+missing_mask = proc_series.isin(missing_protocols) & proc_series.str.contains('/2025-', regex=False, na=False)
 
-# Get full information for missing 2025 protocols
-missing_2025_info = processos_df[processos_df['processo_formatado'].isin(missing_2025)]
+# Get full information for missing 2025 protocols (sorted once)
+missing_2025_info_sorted = processos_df.loc[missing_mask].sort_values('processo_formatado')
+missing_2025_first = missing_2025_info_sorted.drop_duplicates('processo_formatado')
 
 print(f"Total protocols in consolidado_cgfr: {len(consolidado_protocols)}")
 print(f"Total protocols in processos-cgfr: {len(processos_protocols)}")
 print(f"Total missing protocols: {len(missing_protocols)}")
-print(f"Missing protocols from 2025: {len(missing_2025)}")
+print(f"Missing protocols from 2025: {len(missing_2025_first)}")
 print("\n" + "="*80)
 print("MISSING PROTOCOLS FROM 2025:")
 print("="*80 + "\n")
 
-# Sort the missing protocols
-missing_2025_sorted = sorted(missing_2025)
-
-for i, protocol in enumerate(missing_2025_sorted, 1):
-    row = missing_2025_info[missing_2025_info['processo_formatado'] == protocol].iloc[0]
-    print(f"{i}. {protocol}")
-    if pd.notna(row['especificacao']):
-        print(f"   Especificação: {row['especificacao']}")
-    if pd.notna(row['deliberacao']):
-        print(f"   Deliberação: {row['deliberacao']}")
-    if pd.notna(row['tipo_processo']):
-        print(f"   Tipo: {row['tipo_processo']}")
+# One pass over the sorted rows (first row per protocol)
+for i, row in enumerate(missing_2025_first.itertuples(index=False), 1):
+    print(f"{i}. {row.processo_formatado}")
+    if pd.notna(row.especificacao):
+        print(f"   Especificação: {row.especificacao}")
+    if pd.notna(row.deliberacao):
+        print(f"   Deliberação: {row.deliberacao}")
+    if pd.notna(row.tipo_processo):
+        print(f"   Tipo: {row.tipo_processo}")
     print()
 
 # Save to CSV file
-missing_2025_info_sorted = missing_2025_info.sort_values('processo_formatado')
 missing_2025_info_sorted.to_csv('data/missing_protocols_2025.csv', index=False)
 print(f"\nResults saved to: data/missing_protocols_2025.csv")
@@ -7,6 +7,13 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Use the PyArrow CSV reader (multithreaded, Arrow-backed strings) when available
+try:
+    import pyarrow  # noqa: F401
+    CSV_READER_OPTIONS = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+except ImportError:
+    CSV_READER_OPTIONS = {}
+
 # Database connection parameters
 # Try SEI database first, fallback to local if connection fails
 DB_CONFIGS = {
@@ -48,50 +55,43 @@ def connect_to_db():
     print("✗ Failed to connect to any database")
     return None, None
 
-def check_protocol_in_table(cursor, schema, table, protocol):
-    """Check if a protocol exists in a specific table"""
-    # Common column names for protocol
-    possible_columns = ['processo_formatado', 'protocolo_formatado', 'numero_processo', 'protocolo']
-
-    # First, get the actual columns in the table
-    try:
-        cursor.execute(sql.SQL("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s
-        """), [schema, table])
-
-        existing_columns = [row[0] for row in cursor.fetchall()]
+# Common column names for protocol, in order of preference
+POSSIBLE_PROTOCOL_COLUMNS = ['processo_formatado', 'protocolo_formatado', 'numero_processo', 'protocolo']
 
-        # Find which protocol column exists
-        protocol_column = None
-        for col in possible_columns:
-            if col in existing_columns:
-                protocol_column = col
-                break
+def get_protocol_columns(cursor, schema, tables):
+    """Find the protocol column of each table with a single information_schema query"""
+    cursor.execute(sql.SQL("""
+        SELECT table_name, column_name
+        FROM information_schema.columns
+        WHERE table_schema = %s AND table_name = ANY(%s)
+    """), [schema, list(tables)])
 
-        if not protocol_column:
-            return False, "No protocol column found"
+    existing_columns = {}
+    for table_name, column_name in cursor.fetchall():
+        existing_columns.setdefault(table_name, set()).add(column_name)
 
-        # Check if the protocol exists
-        query = sql.SQL("SELECT COUNT(*) FROM {}.{} WHERE {} = %s").format(
-            sql.Identifier(schema),
-            sql.Identifier(table),
-            sql.Identifier(protocol_column)
-        )
+    protocol_columns = {}
+    for table in tables:
+        columns = existing_columns.get(table, set())
+        protocol_columns[table] = next((col for col in POSSIBLE_PROTOCOL_COLUMNS if col in columns), None)
 
-        cursor.execute(query, [protocol])
-        count = cursor.fetchone()[0]
+    return protocol_columns
 
-        return count > 0, protocol_column
+def fetch_existing_protocols(cursor, schema, table, protocol_column, protocols):
+    """Return the subset of protocols present in a table (one query per table)"""
+    query = sql.SQL("SELECT DISTINCT {col} FROM {}.{} WHERE {col} = ANY(%s)").format(
+        sql.Identifier(schema),
+        sql.Identifier(table),
+        col=sql.Identifier(protocol_column)
+    )
 
-    except Exception as e:
-        return False, f"Error: {str(e)}"
+    cursor.execute(query, [protocols])
+    return {row[0] for row in cursor.fetchall()}
 
 def main():
     # Load missing protocols
     print("Loading missing protocols from CSV...")
-    missing_df = pd.read_csv('data/missing_protocols_2025.csv')
+    missing_df = pd.read_csv('data/missing_protocols_2025.csv', usecols=['processo_formatado'], **CSV_READER_OPTIONS)
     protocols = missing_df['processo_formatado'].tolist()
 
     print(f"Found {len(protocols)} protocols to check\n")
@@ -118,7 +118,25 @@ def main():
     print("=" * 80)
     print()
 
-    # Check each protocol
+    # Resolve protocol columns and fetch existing protocols once per table
+    protocol_columns = get_protocol_columns(cursor, schema, TABLES_TO_CHECK)
+    found_by_table = {}
+    for table in TABLES_TO_CHECK:
+        protocol_column = protocol_columns[table]
+        if not protocol_column:
+            print(f"✗ {table}: No protocol column found")
+            found_by_table[table] = set()
+            continue
+
+        try:
+            found_by_table[table] = fetch_existing_protocols(cursor, schema, table, protocol_column, protocols)
+        except Exception as e:
+            print(f"✗ {table}: Error: {str(e)}")
+            conn.rollback()
+            found_by_table[table] = set()
+    print()
+
+    # Check each protocol (in memory)
     for i, protocol in enumerate(protocols, 1):
         print(f"[{i}/{len(protocols)}] Checking protocol: {protocol}")
 
@@ -126,11 +144,11 @@ def main():
         found_in_any = False
 
         for table in TABLES_TO_CHECK:
-            found, info = check_protocol_in_table(cursor, schema, table, protocol)
+            found = protocol in found_by_table[table]
             results[table].append(found)
 
             if found:
-                print(f"  ✓ Found in {table} (column: {info})")
+                print(f"  ✓ Found in {table} (column: {protocol_columns[table]})")
                 found_in_any = True
             else:
                 print(f"  ✗ Not found in {table}")
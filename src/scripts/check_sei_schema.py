@@ -1,79 +1,78 @@
 """Script para verificar o schema da tabela sei_atividades no banco SEI."""
 import sys
+from itertools import groupby
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import inspect, text
+from sqlalchemy import text
 from src.database.session import get_sei_engine
 
 def check_schema():
     engine = get_sei_engine()
-    inspector = inspect(engine)
 
     print("=" * 70)
     print("VERIFICANDO SCHEMA DO BANCO SEI")
     print("=" * 70)
     print()
 
+    try:
+        # Somente leitura: AUTOCOMMIT evita abrir transação
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            schemas = conn.execute(text(
+                "SELECT schema_name FROM information_schema.schemata ORDER BY schema_name"
+            )).scalars().all()
+
+            # Colunas de todas as tabelas do schema em uma única consulta ao catálogo
+            columns = conn.execute(text(
+                "SELECT table_name, column_name, data_type, is_nullable "
+                "FROM information_schema.columns "
+                "WHERE table_schema = 'sei_processo' "
+                "ORDER BY table_name, ordinal_position"
+            )).fetchall()
+    except Exception as e:
+        print(f"Erro ao consultar: {e}")
+        return
+
     # Verifica schemas disponíveis
     print("Schemas disponíveis:")
-    schemas = inspector.get_schema_names()
     for schema in schemas:
         print(f"  - {schema}")
     print()
 
     # Verifica se sei_processo existe
-    if 'sei_processo' in schemas:
-        print("✓ Schema 'sei_processo' encontrado")
+    if 'sei_processo' not in schemas:
+        print("✗ Schema 'sei_processo' NÃO encontrado!")
         print()
+        return
 
-        # Lista tabelas no schema
-        print("Tabelas no schema 'sei_processo':")
-        tables = inspector.get_table_names(schema='sei_processo')
-        for table in sorted(tables):
-            if 'atividad' in table.lower():
-                print(f"  * {table} (relacionada a atividade)")
-            else:
-                print(f"    {table}")
-        print()
+    print("✓ Schema 'sei_processo' encontrado")
+    print()
 
-        # Verifica a tabela de atividades
-        atividade_tables = [t for t in tables if 'atividad' in t.lower()]
+    columns_by_table = {
+        table_name: list(rows)
+        for table_name, rows in groupby(columns, key=lambda row: row.table_name)
+    }
 
-        if atividade_tables:
-            for table_name in atividade_tables:
-                print(f"\nColunas da tabela '{table_name}':")
-                print("-" * 70)
-                columns = inspector.get_columns(table_name, schema='sei_processo')
-                for col in columns:
-                    print(f"  - {col['name']:<30} {str(col['type']):<20} nullable={col['nullable']}")
+    # Lista tabelas no schema
+    print("Tabelas no schema 'sei_processo':")
+    for table in columns_by_table:
+        if 'atividad' in table.lower():
+            print(f"  * {table} (relacionada a atividade)")
         else:
-            print("⚠️ Nenhuma tabela de atividades encontrada!")
-    else:
-        print("✗ Schema 'sei_processo' NÃO encontrado!")
-        print()
-
-    # Tenta query direta para confirmar
-    print("\n" + "=" * 70)
-    print("TESTE DE QUERY DIRETA")
-    print("=" * 70)
-
-    try:
-        with engine.connect() as conn:
-            result = conn.execute(text(
-                "SELECT column_name, data_type "
-                "FROM information_schema.columns "
-                "WHERE table_schema = 'sei_processo' "
-                "AND table_name LIKE '%atividad%' "
-                "ORDER BY table_name, ordinal_position"
-            ))
+            print(f"    {table}")
+    print()
 
-            print("\nColunas encontradas via information_schema:")
-            for row in result:
-                print(f"  {row[0]:<30} {row[1]}")
+    # Verifica a tabela de atividades
+    atividade_tables = [t for t in columns_by_table if 'atividad' in t.lower()]
 
-    except Exception as e:
-        print(f"Erro ao consultar: {e}")
+    if atividade_tables:
+        for table_name in atividade_tables:
+            print(f"\nColunas da tabela '{table_name}':")
+            print("-" * 70)
+            for col in columns_by_table[table_name]:
+                print(f"  - {col.column_name:<30} {col.data_type:<20} nullable={col.is_nullable == 'YES'}")
+    else:
+        print("⚠️ Nenhuma tabela de atividades encontrada!")
 
 if __name__ == "__main__":
     check_schema()
@@ -2,7 +2,7 @@
 Script para baixar documentos dos processos e armazenar no MinIO.
 
 Este script:
-1. Lê documentos com status='pending' da tabela sei_documentos
+1. Reserva em blocos documentos com status='pending' da tabela sei_documentos
 2. Baixa cada documento via API SEI em paralelo
 3. Salva no MinIO (bucket: sei-documentos/{protocol}/{id_documento}.pdf)
 4. Atualiza status no Postgres para 'completed'
@@ -10,19 +10,25 @@ Este script:
 import sys
 import asyncio
 import hashlib
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
-from io import BytesIO
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+
+import aiohttp
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import select, and_
+from sqlalchemy import Integer, String, and_, any_, bindparam, case, cast, func, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from loguru import logger
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 from minio import Minio
 from minio.error import S3Error
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from src.config import settings
 from src.database.session import get_local_session
@@ -45,7 +51,11 @@ def setup_logger():
         "logs/download_documentos_{time}.log",
         rotation="100 MB",
         retention="10 days",
-        level="DEBUG"
+        level="DEBUG",
+        # Escrita em thread própria: o event loop não espera o disco
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
 
 
@@ -69,7 +79,7 @@ def init_minio_client() -> Minio:
             client.make_bucket(bucket)
             logger.info(f"Bucket '{bucket}' criado no MinIO")
         else:
-            logger.debug(f"Bucket '{bucket}' já existe")
+            logger.debug("Bucket '{}' já existe", bucket)
     except S3Error as e:
         logger.error(f"Erro ao verificar/criar bucket: {e}")
         raise
@@ -77,143 +87,690 @@ def init_minio_client() -> Minio:
     return client
 
 
-def calculate_sha256(data: bytes) -> str:
-    """Calcula SHA256 de um conteúdo.
+# '/' e '.' do protocolo viram '-' no caminho (uma única passada)
+PROTOCOL_PATH_TABLE = str.maketrans('/.', '--')
+
+# Tamanho de parte do multipart upload quando o tamanho total não é conhecido
+MINIO_PART_SIZE = 16 * 1024 * 1024
+
+# Máximo de HEADs (stat_object) simultâneos na verificação de objetos existentes
+MINIO_HEAD_CONCURRENCY = 16
+
+# Reservas ('downloading') sem atualização há mais que isso são consideradas
+# abandonadas por uma execução interrompida e voltam para a fila
+CLAIM_LEASE = timedelta(hours=1)
+
+
+class AsyncChunkReader:
+    """Adapta um iterador assíncrono de blocos à interface `read(n)` do MinIO.
+
+    `put_object` roda em uma thread (asyncio.to_thread) e chama `read`; cada
+    bloco é buscado no event loop via `run_coroutine_threadsafe`. O SHA256 e
+    o tamanho são calculados na mesma passada, sem montar o conteúdo inteiro.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop, first_chunk: bytes = b''):
+        self._chunks = chunks
+        self._loop = loop
+        self._buffer = bytearray()
+        self._eof = False
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        self._append(first_chunk)
+
+    def _append(self, chunk: bytes):
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+        self._buffer += chunk
+
+    def _next_chunk(self) -> Optional[bytes]:
+        future = asyncio.run_coroutine_threadsafe(anext(self._chunks, None), self._loop)
+        return future.result()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._next_chunk()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._append(chunk)
+
+        if size < 0 or size > len(self._buffer):
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limite de downloads simultâneos ajustado por AIMD.
+
+    Funciona como um semáforo redimensionável: a cada janela de `window`
+    segundos compara a vazão (bytes/s, suavizada por EWMA) e a taxa de erros
+    de sobrecarga (timeouts, conexão, 429 e 5xx). Se não houve erros acima de
+    1% e a vazão cresceu pelo menos 5%, o limite sobe em 1; se houve erros ou
+    a vazão caiu mais de 20%, o limite cai pela metade. Reduzir o limite só
+    impede novas aquisições até que as em andamento terminem.
+    """
+
+    def __init__(self, initial: int = 4, maximum: int = 20, window: float = 10.0, alpha: float = 0.3):
+        self.maximum = max(1, maximum)
+        self.limit = max(1, min(initial, self.maximum))
+        self.window = window
+        self.alpha = alpha
+
+        self._in_flight = 0
+        self._waiters: deque = deque()
+
+        # Métricas da janela corrente
+        self._window_bytes = 0
+        self._window_requests = 0
+        self._window_errors = 0
+        self._window_started = time.monotonic()
+        self._throughput_ewma: Optional[float] = None
+
+    async def acquire(self):
+        """Aguarda uma vaga dentro do limite corrente."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # A vaga chegou a ser concedida: devolve
+                self.release()
+            raise
+
+    def release(self):
+        """Libera uma vaga e acorda os próximos da fila, se houver espaço."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self):
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    def record_success(self, nbytes: int):
+        self._window_requests += 1
+        self._window_bytes += nbytes
+
+    def record_failure(self, overload: bool):
+        """Registra uma falha; só erros de sobrecarga reduzem o limite."""
+        self._window_requests += 1
+        if overload:
+            self._window_errors += 1
+
+    def adjust(self):
+        """Fecha a janela de métricas corrente e ajusta o limite."""
+        now = time.monotonic()
+        elapsed = max(now - self._window_started, 1e-6)
+        throughput = self._window_bytes / elapsed
+        requests, errors = self._window_requests, self._window_errors
+
+        self._window_bytes = self._window_requests = self._window_errors = 0
+        self._window_started = now
+
+        if not requests:
+            return
+
+        previous = self._throughput_ewma
+        self._throughput_ewma = throughput if previous is None else (
+            self.alpha * throughput + (1 - self.alpha) * previous
+        )
+
+        old_limit = self.limit
+        error_rate = errors / requests
+        if error_rate >= 0.01 or (previous and throughput < previous * 0.8):
+            self.limit = max(1, self.limit // 2)
+        elif previous is None or throughput >= previous * 1.05:
+            self.limit = min(self.maximum, self.limit + 1)
+
+        if self.limit != old_limit:
+            logger.info(
+                f"Concorrência ajustada: {old_limit} -> {self.limit} "
+                f"(vazão {throughput / 1024:.0f} KiB/s, erros {error_rate:.1%})"
+            )
+            self._wake_waiters()
+
+    async def run_controller(self):
+        """Laço do controlador; executar como task em segundo plano."""
+        while True:
+            await asyncio.sleep(self.window)
+            self.adjust()
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Indica se a falha sinaliza sobrecarga (API ou rede) e não um erro do documento."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+class CircuitOpenError(Exception):
+    """Circuito aberto: a API SEI está falhando e novos downloads não são tentados."""
+    pass
+
+
+class CircuitBreaker:
+    """Circuit breaker pela taxa de erros de sobrecarga no último minuto.
+
+    Abre quando, com pelo menos `min_requests` chamadas na janela, mais de
+    `threshold` delas falharam por sobrecarga; fica aberto por `cooldown`
+    segundos e depois volta a deixar passar chamadas (com a janela zerada).
+    """
+
+    def __init__(self, window: float = 60.0, threshold: float = 0.5, min_requests: int = 10, cooldown: float = 30.0):
+        self.window = window
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self._events: deque = deque()  # (instante, falhou)
+        self._errors = 0
+        self._open_until = 0.0
+
+    def _expire(self, now: float):
+        while self._events and self._events[0][0] < now - self.window:
+            _, failed = self._events.popleft()
+            self._errors -= failed
+
+    def check(self):
+        """Levanta CircuitOpenError se o circuito estiver aberto."""
+        if time.monotonic() < self._open_until:
+            raise CircuitOpenError("Circuito aberto: API SEI com alta taxa de erros")
+
+    def record(self, failed: bool):
+        now = time.monotonic()
+        self._events.append((now, failed))
+        self._errors += failed
+        self._expire(now)
+
+        total = len(self._events)
+        if failed and total >= self.min_requests and self._errors / total > self.threshold:
+            logger.warning(
+                f"Circuito aberto por {self.cooldown:.0f}s: "
+                f"{self._errors}/{total} falhas de sobrecarga no último minuto"
+            )
+            self._open_until = now + self.cooldown
+            self._events.clear()
+            self._errors = 0
+
+
+circuit_breaker = CircuitBreaker()
+
+
+async def open_documento_stream(
+    api_client: SeiAPIClient,
+    id_unidade: str,
+    protocolo_documento: str
+) -> Tuple[AsyncIterator[bytes], Optional[bytes]]:
+    """Abre o stream de download do documento com retry e circuit breaker.
+
+    Só o início do download (até o primeiro bloco) é retentado: depois que o
+    upload começa a consumir o stream, uma falha encerra a tentativa. Erros de
+    sobrecarga são retentados até 5 vezes com backoff exponencial com jitter
+    (1s a 60s).
 
     Args:
-        data: Dados binários
+        api_client: Cliente da API SEI
+        id_unidade: ID da unidade
+        protocolo_documento: Protocolo do documento
 
     Returns:
-        Hash SHA256 hexadecimal
+        Tupla (stream, primeiro bloco ou None se o documento estiver vazio)
     """
-    return hashlib.sha256(data).hexdigest()
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential_jitter(initial=1, max=60),
+        retry=retry_if_exception(is_overload_error),
+        reraise=True,
+    ):
+        with attempt:
+            circuit_breaker.check()
+
+            chunks = api_client.baixar_documento_stream(id_unidade, protocolo_documento)
+            try:
+                first_chunk = await anext(chunks, None)
+            except Exception as e:
+                await chunks.aclose()
+                circuit_breaker.record(failed=is_overload_error(e))
+                raise
+
+            circuit_breaker.record(failed=False)
+            return chunks, first_chunk
+
+
+def documento_object_name(documento: SeiDocumento) -> str:
+    """Chave do documento no MinIO, no formato {protocol}/{id_documento}.pdf."""
+    protocol_safe = documento.protocol.translate(PROTOCOL_PATH_TABLE)
+    return f"{protocol_safe}/{documento.id_documento}.pdf"
+
+
+async def find_existing_object(
+    minio_client: Minio,
+    documento: SeiDocumento,
+    semaphore: asyncio.Semaphore
+) -> Optional[Dict[str, Any]]:
+    """Verifica (HEAD) se o documento já está no MinIO.
+
+    Cobre documentos enviados por uma execução anterior que caiu antes de
+    gravar o status. Uploads multipart só ficam visíveis quando concluídos,
+    então um objeto existente está completo. A verificação é só uma
+    otimização: qualquer falha do HEAD (erro S3 que não seja objeto
+    inexistente, erro de conexão) é registrada e o documento segue para o
+    download normal.
+
+    Args:
+        minio_client: Cliente MinIO
+        documento: Documento a verificar
+        semaphore: Limita os HEADs simultâneos
+
+    Returns:
+        Linha de atualização como 'completed', ou None se o objeto não
+        existir (ou não puder ser verificado)
+    """
+    object_name = documento_object_name(documento)
+    async with semaphore:
+        try:
+            obj = await asyncio.to_thread(minio_client.stat_object, settings.minio_bucket, object_name)
+        except S3Error as e:
+            if e.code not in ('NoSuchKey', 'NoSuchObject'):
+                logger.warning("HEAD de {} falhou ({}); baixando normalmente", object_name, e.code)
+            return None
+        except Exception as e:
+            logger.warning("HEAD de {} falhou ({}); baixando normalmente", object_name, e)
+            return None
+
+    return {
+        'id': documento.id,
+        'status': 'completed',
+        'minio_bucket': settings.minio_bucket,
+        'minio_path': obj.object_name,
+        'tamanho_bytes': obj.size,
+        # Hash desconhecido: o ETag do MinIO não é o SHA256 do conteúdo
+        'hash_sha256': documento.hash_sha256,
+        'downloaded_at': obj.last_modified.replace(tzinfo=None) if obj.last_modified else datetime.utcnow(),
+        'last_error': None,
+    }
 
 
 async def download_and_save_documento(
     api_client: SeiAPIClient,
     minio_client: Minio,
     documento: SeiDocumento,
-    id_unidade: str
-) -> bool:
+    id_unidade: str,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+) -> Dict[str, Any]:
     """Baixa documento da API e salva no MinIO.
 
+    Não acessa o banco: devolve a linha de atualização do documento, que
+    `process_documentos` grava em lote com as demais.
+
     Args:
         api_client: Cliente da API SEI
         minio_client: Cliente MinIO
         documento: Objeto SeiDocumento
         id_unidade: ID da unidade
+        limiter: Controle de concorrência que recebe o resultado (opcional)
 
     Returns:
-        True se sucesso, False caso contrário
+        Dicionário com `id` e as colunas a atualizar (status 'completed',
+        'pending' ou 'error')
     """
     protocol = documento.protocol
     id_doc = str(documento.id_documento)
     protocolo_doc = f"{id_doc}"  # API usa id_documento como protocolo
+    object_name = documento_object_name(documento)
 
+    chunks = None
     try:
-        # Atualiza status para 'downloading'
-        with get_local_session() as session:
-            doc = session.query(SeiDocumento).filter_by(id=documento.id).first()
-            if doc:
-                doc.status = 'downloading'
-                doc.download_attempts += 1
-                doc.updated_at = datetime.utcnow()
-                session.commit()
-
-        # 1. Baixa documento da API
-        logger.debug(f"Baixando documento {protocol}/{id_doc}")
-        content = await api_client.baixar_documento(id_unidade, protocolo_doc)
-
-        if not content:
-            raise Exception("Documento vazio retornado pela API")
-
-        # 2. Calcula hash
-        hash_sha256 = calculate_sha256(content)
+        # 1. Inicia o download; o primeiro bloco confirma que o documento não está vazio
+        logger.debug("Baixando documento {}/{}", protocol, id_doc)
+        chunks, first_chunk = await open_documento_stream(api_client, id_unidade, protocolo_doc)
 
-        # 3. Define caminho no MinIO
-        # Formato: {protocol}/{id_documento}.pdf
-        protocol_safe = protocol.replace('/', '-').replace('.', '-')
-        object_name = f"{protocol_safe}/{id_doc}.pdf"
-
-        # 4. Upload para MinIO
-        logger.debug(f"Salvando no MinIO: {object_name} ({len(content)} bytes)")
+        if not first_chunk:
+            raise Exception("Documento vazio retornado pela API")
 
-        minio_client.put_object(
+        # 2. Upload para MinIO em streaming (multipart), calculando hash e tamanho
+        #    durante a leitura, sem manter o documento inteiro em memória
+        logger.debug("Enviando para o MinIO: {}", object_name)
+        reader = AsyncChunkReader(chunks, asyncio.get_running_loop(), first_chunk)
+        await asyncio.to_thread(
+            minio_client.put_object,
             bucket_name=settings.minio_bucket,
             object_name=object_name,
-            data=BytesIO(content),
-            length=len(content),
+            data=reader,
+            length=-1,
+            part_size=MINIO_PART_SIZE,
             content_type='application/pdf'
         )
+        content_length = reader.size
+        hash_sha256 = reader.sha256.hexdigest()
 
-        # 5. Atualiza banco
-        with get_local_session() as session:
-            doc = session.query(SeiDocumento).filter_by(id=documento.id).first()
-            if doc:
-                doc.status = 'completed'
-                doc.minio_bucket = settings.minio_bucket
-                doc.minio_path = object_name
-                doc.tamanho_bytes = len(content)
-                doc.hash_sha256 = hash_sha256
-                doc.downloaded_at = datetime.utcnow()
-                doc.updated_at = datetime.utcnow()
-                doc.last_error = None
-                session.commit()
+        if limiter:
+            limiter.record_success(content_length)
 
         logger.success(f"Documento {protocol}/{id_doc} salvo com sucesso")
-        return True
+        return {
+            'id': documento.id,
+            'status': 'completed',
+            'minio_bucket': settings.minio_bucket,
+            'minio_path': object_name,
+            'tamanho_bytes': content_length,
+            'hash_sha256': hash_sha256,
+            'downloaded_at': datetime.utcnow(),
+            'last_error': None,
+        }
+
+    except CircuitOpenError as e:
+        logger.warning(f"Documento {protocol}/{id_doc} adiado: {e}")
+
+        if limiter:
+            limiter.record_failure(overload=True)
+
+        # Volta para pending sem consumir uma tentativa
+        return {
+            'id': documento.id,
+            'status': 'pending',
+            'download_attempts': documento.download_attempts - 1,
+            'last_error': str(e),
+        }
 
     except Exception as e:
         logger.error(f"Erro ao baixar documento {protocol}/{id_doc}: {e}")
 
-        # Atualiza banco com erro
-        with get_local_session() as session:
-            doc = session.query(SeiDocumento).filter_by(id=documento.id).first()
-            if doc:
-                # Se já tentou 3 vezes, marca como error, senão volta para pending
-                if doc.download_attempts >= 3:
-                    doc.status = 'error'
-                else:
-                    doc.status = 'pending'
+        if limiter:
+            limiter.record_failure(overload=is_overload_error(e))
+
+        # Se já tentou 3 vezes (a reserva já contou esta), marca como error, senão volta para pending
+        attempts = documento.download_attempts
+        return {
+            'id': documento.id,
+            'status': 'error' if attempts >= 3 else 'pending',
+            'last_error': str(e)[:500],  # Limita tamanho do erro
+        }
+
+    finally:
+        if chunks is not None:
+            await chunks.aclose()
 
-                doc.last_error = str(e)[:500]  # Limita tamanho do erro
-                doc.updated_at = datetime.utcnow()
-                session.commit()
 
-        return False
+def claim_documentos(batch_size: int, after: Optional[Tuple[datetime, int]] = None) -> List[SeiDocumento]:
+    """Reserva um lote de documentos pendentes em um único UPDATE.
 
+    UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING:
+    marca como 'downloading' e conta a tentativa na mesma instrução, e
+    processos concorrentes nunca reservam o mesmo documento. A fila segue
+    a ordem de criação (created_at, id), servida pelo índice parcial
+    ix_sei_documentos_pending.
 
-async def process_batch(
+    Args:
+        batch_size: Quantidade máxima de documentos
+        after: (created_at, id) do último documento já reservado; reserva
+            apenas os seguintes (evita retomar na mesma execução documentos
+            que voltaram para 'pending')
+
+    Returns:
+        Documentos reservados, em ordem de (created_at, id)
+    """
+    queue_key = tuple_(SeiDocumento.created_at, SeiDocumento.id)
+    pending_ids = (
+        select(SeiDocumento.id)
+        .where(
+            and_(
+                SeiDocumento.status == 'pending',
+                SeiDocumento.download_attempts < 3,
+                queue_key > tuple_(*after) if after is not None else true()
+            )
+        )
+        .order_by(SeiDocumento.created_at, SeiDocumento.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    with get_local_session() as session:
+        documentos = session.scalars(
+            update(SeiDocumento)
+            .where(SeiDocumento.id.in_(pending_ids))
+            .values(status='downloading', download_attempts=SeiDocumento.download_attempts + 1)
+            .returning(SeiDocumento)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+    return sorted(documentos, key=lambda doc: (doc.created_at, doc.id))
+
+
+def release_claims(ids: List[int]):
+    """Devolve para 'pending' documentos reservados que não terminaram.
+
+    Usado ao encerrar (Ctrl-C ou falha) para que os blocos já reservados
+    voltem à fila; a tentativa contada na reserva é desfeita, já que o
+    download não chegou a terminar.
+
+    Args:
+        ids: IDs dos documentos reservados sem resultado gravado
+    """
+    with get_local_session() as session:
+        session.execute(
+            update(SeiDocumento)
+            .where(
+                and_(
+                    SeiDocumento.id == any_(bindparam('ids', ids, type_=ARRAY(Integer))),
+                    SeiDocumento.status == 'downloading'
+                )
+            )
+            .values(status='pending', download_attempts=SeiDocumento.download_attempts - 1)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def reclaim_stale_claims() -> int:
+    """Devolve para a fila reservas abandonadas por execuções que morreram.
+
+    Documentos em 'downloading' sem atualização há mais que `CLAIM_LEASE`
+    voltam para 'pending' (ou 'error', se já esgotaram as 3 tentativas).
+    A tentativa da reserva abandonada continua contada.
+
+    Returns:
+        Quantidade de documentos devolvidos
+    """
+    with get_local_session() as session:
+        result = session.execute(
+            update(SeiDocumento)
+            .where(
+                and_(
+                    SeiDocumento.status == 'downloading',
+                    SeiDocumento.updated_at < func.timezone('utc', func.now()) - CLAIM_LEASE
+                )
+            )
+            .values(
+                status=cast(
+                    case((SeiDocumento.download_attempts >= 3, 'error'), else_='pending'),
+                    SeiDocumento.status.type
+                ),
+                last_error='Reserva expirada (execução interrompida)'
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+def save_documentos_results(rows: List[Dict[str, Any]]):
+    """Grava o resultado de um lote de downloads.
+
+    Usa UPDATE em lote por chave primária (executemany); linhas de sucesso
+    e de erro têm colunas diferentes e viram um executemany cada.
+    """
+    with get_local_session() as session:
+        session.execute(update(SeiDocumento), rows)
+
+
+async def iter_claimed_blocks(batch_size: int, limit: Optional[int] = None) -> AsyncIterator[List[SeiDocumento]]:
+    """Reserva e entrega blocos de documentos pendentes até esgotar a fila.
+
+    Cada bloco é reservado por `claim_documentos` (em uma thread) só quando
+    o anterior já foi entregue, sem manter a lista inteira em memória nem
+    uma transação aberta durante os downloads.
+
+    Args:
+        batch_size: Tamanho de cada bloco
+        limit: Máximo de documentos a reservar (None = todos)
+
+    Yields:
+        Listas de até `batch_size` documentos já marcados como 'downloading'
+    """
+    after = None
+    claimed = 0
+
+    while limit is None or claimed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - claimed)
+        block = await asyncio.to_thread(claim_documentos, size, after)
+        if not block:
+            return
+
+        claimed += len(block)
+        after = (block[-1].created_at, block[-1].id)
+        yield block
+
+
+async def process_documentos(
     api_client: SeiAPIClient,
     minio_client: Minio,
-    documentos: list,
+    blocks: AsyncIterator[List[SeiDocumento]],
     id_unidade: str,
+    batch_size: int,
     progress,
     task_id
-):
-    """Processa um lote de documentos em paralelo.
+) -> Tuple[int, Set[str]]:
+    """Processa os documentos com janela deslizante de downloads simultâneos.
+
+    O número de downloads em andamento é ajustado por
+    `AdaptiveConcurrencyLimiter` (começa em 4, teto `batch_size` limitado à
+    concorrência do `api_client`: acima dela o controlador mediria só a
+    espera na fila do próprio cliente); assim que um termina, o próximo
+    começa, sem esperar o documento mais lento de um lote. O banco continua sendo acessado em lote: os blocos chegam já
+    reservados e os resultados são gravados em um UPDATE em lote a cada
+    `batch_size` documentos, no executor. Documentos cujo objeto já existe
+    no MinIO são marcados como concluídos sem novo download.
 
     Args:
         api_client: Cliente da API
         minio_client: Cliente MinIO
-        documentos: Lista de documentos
+        blocks: Blocos de até `batch_size` documentos reservados (ver `iter_claimed_blocks`)
         id_unidade: ID da unidade
+        batch_size: Teto de downloads simultâneos (no máximo `api_client.max_concurrent`)
         progress: Objeto Rich Progress
         task_id: ID da task no progress
+
+    Returns:
+        Tupla (quantidade baixada com sucesso, protocolos processados)
     """
-    tasks = [
-        download_and_save_documento(api_client, minio_client, doc, id_unidade)
-        for doc in documentos
-    ]
+    limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=min(batch_size, api_client.max_concurrent))
+    controller = asyncio.create_task(limiter.run_controller())
+    results: List[Dict[str, Any]] = []
+    success_count = 0
+    protocols: Set[str] = set()
+    # Reservados nesta execução e ainda sem resultado
+    unfinished: Set[int] = set()
+
+    async def flush_results():
+        rows = results.copy()
+        results.clear()
+        if rows:
+            await asyncio.to_thread(save_documentos_results, rows)
+
+    async def add_result(result: Dict[str, Any]):
+        nonlocal success_count
+        results.append(result)
+        unfinished.discard(result['id'])
+        if result['status'] == 'completed':
+            success_count += 1
+        progress.update(task_id, advance=1)
+
+        if len(results) >= batch_size:
+            await flush_results()
+
+    async def finish():
+        await flush_results()
+        if unfinished:
+            logger.warning(f"Devolvendo {len(unfinished)} documentos reservados não processados para a fila")
+            await asyncio.to_thread(release_claims, list(unfinished))
+
+    head_semaphore = asyncio.Semaphore(MINIO_HEAD_CONCURRENCY)
+
+    async def process_one(documento: SeiDocumento):
+        try:
+            # Já enviado por uma execução anterior: só registra o status
+            result = await find_existing_object(minio_client, documento, head_semaphore)
+            if result is None:
+                result = await download_and_save_documento(api_client, minio_client, documento, id_unidade, limiter)
+        finally:
+            limiter.release()
+
+        await add_result(result)
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        async with asyncio.TaskGroup() as tg:
+            async for block in blocks:
+                protocols.update(doc.protocol for doc in block)
+                unfinished.update(doc.id for doc in block)
+
+                for documento in block:
+                    # Só cria a task quando há vaga na janela
+                    await limiter.acquire()
+                    tg.create_task(process_one(documento))
+    finally:
+        controller.cancel()
+        # Grava os resultados já obtidos mesmo após Ctrl-C ou falha de uma
+        # task (esses documentos já estão no MinIO) e devolve à fila o que
+        # foi reservado e não chegou a terminar
+        await asyncio.shield(finish())
 
-    # Conta sucessos
-    success_count = sum(1 for r in results if r is True)
+    return success_count, protocols
 
-    progress.update(task_id, advance=len(documentos))
 
-    return success_count
+def update_etl_documentos_status(protocols: Set[str]):
+    """Atualiza documentos_downloaded/documentos_status dos protocolos.
+
+    Um único UPDATE ... FROM sobre a agregação (GROUP BY protocol) dos
+    documentos, em vez de duas contagens e um SELECT+UPDATE por protocolo.
+
+    Args:
+        protocols: Protocolos cujos documentos foram processados
+    """
+    if not protocols:
+        return
+
+    counts = (
+        select(
+            SeiDocumento.protocol,
+            func.count().label('total'),
+            func.count().filter(SeiDocumento.status == 'completed').label('completed'),
+        )
+        .where(SeiDocumento.protocol == any_(bindparam('protocols', list(protocols), type_=ARRAY(String))))
+        .group_by(SeiDocumento.protocol)
+        .subquery()
+    )
+
+    with get_local_session() as session:
+        session.execute(
+            update(SeiETLStatus)
+            .where(SeiETLStatus.protocol == counts.c.protocol)
+            .values(
+                documentos_downloaded=counts.c.completed,
+                documentos_status=case(
+                    (counts.c.completed == counts.c.total, 'completed'),
+                    else_=SeiETLStatus.documentos_status
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
 
 async def download_all_documentos(
@@ -225,11 +782,17 @@ async def download_all_documentos(
 
     Args:
         id_unidade: ID da unidade SEI
-        batch_size: Tamanho do lote para download paralelo
+        batch_size: Teto de downloads simultâneos (e tamanho dos lotes de UPDATE)
         limit: Limite de documentos a baixar (None = todos)
     """
     setup_logger()
 
+    # Cada upload para o MinIO ocupa uma thread do executor padrão enquanto
+    # consome o stream da API; o pool precisa comportar a janela inteira
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(32, batch_size * 2), thread_name_prefix='minio-upload')
+    )
+
     console.print("\n[bold cyan]═══════════════════════════════════════════════════════════[/bold cyan]")
     console.print("[bold cyan]  Download de Documentos para MinIO - Execução Paralela  [/bold cyan]")
     console.print("[bold cyan]═══════════════════════════════════════════════════════════[/bold cyan]\n")
@@ -239,30 +802,31 @@ async def download_all_documentos(
     minio_client = init_minio_client()
     console.print("[green]✓ MinIO pronto[/green]\n")
 
-    # Busca documentos pendentes
+    stale = reclaim_stale_claims()
+    if stale:
+        logger.warning(f"{stale} reservas abandonadas por execuções anteriores voltaram para a fila")
+
+    # Estimativa para a barra de progresso; os documentos em si são
+    # reservados em blocos durante o download
     with get_local_session() as session:
-        stmt = (
-            select(SeiDocumento)
+        total = session.scalar(
+            select(func.count())
+            .select_from(SeiDocumento)
             .where(
                 and_(
                     SeiDocumento.status == 'pending',
                     SeiDocumento.download_attempts < 3
                 )
             )
-            .order_by(SeiDocumento.created_at)
         )
 
-        if limit:
-            stmt = stmt.limit(limit)
-
-        result = session.execute(stmt)
-        documentos = result.scalars().all()
+    if limit:
+        total = min(total, limit)
 
-    if not documentos:
+    if not total:
         console.print("[yellow]Nenhum documento pendente para download![/yellow]")
         return
 
-    total = len(documentos)
     console.print(f"[green]Total de documentos a baixar: {total:,}[/green]\n")
     logger.info(f"Iniciando download de {total} documentos")
 
@@ -282,50 +846,29 @@ async def download_all_documentos(
             BarColumn(),
             TaskProgressColumn(),
             TimeRemainingColumn(),
-            console=console
+            console=console,
+            # Avança a cada documento, mas redesenha só 2x por segundo
+            refresh_per_second=2,
+            transient=True
         ) as progress:
 
             task = progress.add_task(
-                f"[cyan]Baixando documentos (lote: {batch_size})...",
+                f"[cyan]Baixando documentos (até {min(batch_size, api_client.max_concurrent)} simultâneos)...",
                 total=total
             )
 
-            # Processa em lotes
-            total_success = 0
-            for i in range(0, total, batch_size):
-                batch = documentos[i:i + batch_size]
-                success = await process_batch(
-                    api_client,
-                    minio_client,
-                    batch,
-                    id_unidade,
-                    progress,
-                    task
-                )
-                total_success += success
+            total_success, protocols = await process_documentos(
+                api_client,
+                minio_client,
+                iter_claimed_blocks(batch_size, limit),
+                id_unidade,
+                batch_size,
+                progress,
+                task
+            )
 
     # Atualiza status geral de ETL
-    with get_local_session() as session:
-        # Para cada protocolo, verifica se todos os documentos foram baixados
-        protocols = set(doc.protocol for doc in documentos)
-
-        for protocol in protocols:
-            docs_total = session.query(SeiDocumento).filter_by(protocol=protocol).count()
-            docs_completed = session.query(SeiDocumento).filter(
-                and_(
-                    SeiDocumento.protocol == protocol,
-                    SeiDocumento.status == 'completed'
-                )
-            ).count()
-
-            etl = session.query(SeiETLStatus).filter_by(protocol=protocol).first()
-            if etl:
-                etl.documentos_downloaded = docs_completed
-                if docs_completed == docs_total:
-                    etl.documentos_status = 'completed'
-                etl.updated_at = datetime.utcnow()
-
-        session.commit()
+    update_etl_documentos_status(protocols)
 
     console.print(f"\n[bold green]✓ Download concluído![/bold green]")
     console.print(f"[bold green]  Documentos baixados com sucesso: {total_success:,}/{total:,}[/bold green]\n")
@@ -338,11 +881,18 @@ def main():
 
     parser = argparse.ArgumentParser(description="Download de documentos para MinIO")
     parser.add_argument("--id-unidade", required=True, help="ID da unidade SEI")
-    parser.add_argument("--batch-size", type=int, default=20, help="Tamanho do lote paralelo")
+    parser.add_argument("--batch-size", type=int, default=20, help="Teto de downloads simultâneos (ajuste adaptativo a partir de 4)")
     parser.add_argument("--limit", type=int, help="Limite de documentos a baixar")
 
     args = parser.parse_args()
 
+    # Event loop do uvloop quando instalado (opcional; não disponível no Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(download_all_documentos(
             id_unidade=args.id_unidade,
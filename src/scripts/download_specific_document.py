@@ -14,11 +14,11 @@ Uso:
         --protocol "00002.006238/2025-95"
 """
 import sys
-import re
 import asyncio
 import hashlib
+from email.message import Message
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -36,6 +36,9 @@ from src.api.sei_client import SeiAPIClient, SeiUnidadeAccessError, SeiPermanent
 
 console = Console()
 
+# '/' e '.' do protocolo viram '-' no caminho (uma única passada)
+PROTOCOL_PATH_TABLE = str.maketrans('/.', '--')
+
 
 def setup_logger():
     """Configura o logger."""
@@ -53,18 +56,6 @@ def setup_logger():
     )
 
 
-def calculate_sha256(data: bytes) -> str:
-    """Calcula SHA256 de um conteúdo.
-
-    Args:
-        data: Dados binários
-
-    Returns:
-        Hash SHA256 hexadecimal
-    """
-    return hashlib.sha256(data).hexdigest()
-
-
 def extract_filename_from_content_disposition(content_disposition: str) -> Optional[str]:
     """Extrai o nome do arquivo do header Content-Disposition.
 
@@ -78,17 +69,22 @@ def extract_filename_from_content_disposition(content_disposition: str) -> Optio
     if not content_disposition:
         return None
 
-    # Procura por filename="..."
-    match = re.search(r'filename="([^"]+)"', content_disposition)
-    if match:
-        return match.group(1)
+    # Parser de headers MIME da stdlib: trata aspas, ';' dentro do nome e
+    # filename* (RFC 2231/5987, ex: filename*=UTF-8''of%C3%ADcio.pdf)
+    message = Message()
+    message['content-disposition'] = content_disposition
+    filename = message.get_filename()
 
-    # Procura por filename=... (sem aspas)
-    match = re.search(r'filename=([^\s;]+)', content_disposition)
-    if match:
-        return match.group(1)
+    if not filename:
+        return None
 
-    return None
+    # Descarta diretórios: o nome vem do servidor e é usado como caminho local.
+    # Barras invertidas também separam diretórios (no Linux, um nome como
+    # '..' + barra invertida + 'x' seria tratado como um único componente).
+    name = Path(filename.replace('\\', '/')).name
+    if name in ('', '.', '..'):
+        return None
+    return name
 
 
 def get_unidade_id_from_database(protocol: str) -> Optional[str]:
@@ -102,13 +98,13 @@ def get_unidade_id_from_database(protocol: str) -> Optional[str]:
     """
     try:
         with get_local_session() as session:
-            stmt = select(SeiProcesso).where(SeiProcesso.protocol == protocol)
-            result = session.execute(stmt)
-            processo = result.scalar_one_or_none()
+            # Busca apenas a coluna necessária, sem materializar o objeto ORM
+            stmt = select(SeiProcesso.id_unidade).where(SeiProcesso.protocol == protocol)
+            id_unidade = session.execute(stmt).scalar_one_or_none()
 
-            if processo and processo.id_unidade:
-                logger.info(f"Unidade encontrada no banco: {processo.id_unidade}")
-                return str(processo.id_unidade)
+            if id_unidade:
+                logger.info(f"Unidade encontrada no banco: {id_unidade}")
+                return str(id_unidade)
 
         logger.debug(f"Processo {protocol} não encontrado no banco de dados")
         return None
@@ -123,8 +119,11 @@ async def try_download_with_unidades(
     protocol: str,
     document_id: str,
     unidade_ids: list[str]
-) -> Optional[tuple[bytes, str, dict]]:
-    """Tenta baixar documento usando uma lista de unidades.
+) -> Optional[tuple[AsyncIterator[bytes], bytes, str, dict]]:
+    """Tenta iniciar o download do documento usando uma lista de unidades.
+
+    Cada unidade é testada até o primeiro bloco do conteúdo; o restante do
+    stream fica aberto para quem chamou consumir (e fechar).
 
     Args:
         api_client: Cliente da API SEI
@@ -133,22 +132,26 @@ async def try_download_with_unidades(
         unidade_ids: Lista de IDs de unidades para tentar
 
     Returns:
-        Tupla (conteúdo_binário, unidade_id_usada, headers) se sucesso, None se falhar
+        Tupla (stream, primeiro_bloco, unidade_id_usada, headers) se sucesso, None se falhar
     """
     for id_unidade in unidade_ids:
+        logger.debug(f"Tentando baixar documento com unidade {id_unidade}...")
+
+        # Headers da resposta são preenchidos antes do primeiro bloco
+        headers: dict = {}
+        chunks = api_client.baixar_documento_stream(
+            id_unidade=id_unidade,
+            protocolo_documento=document_id,
+            response_headers=headers
+        )
+        opened = False
         try:
-            logger.debug(f"Tentando baixar documento com unidade {id_unidade}...")
-
-            # Tenta baixar o documento com headers
-            content, headers = await api_client.baixar_documento(
-                id_unidade=id_unidade,
-                protocolo_documento=document_id,
-                return_headers=True
-            )
+            first_chunk = await anext(chunks, None)
 
-            if content and len(content) > 0:
-                logger.success(f"Documento baixado com sucesso usando unidade {id_unidade}")
-                return (content, id_unidade, headers)
+            if first_chunk:
+                logger.success(f"Documento disponível usando unidade {id_unidade}")
+                opened = True
+                return (chunks, first_chunk, id_unidade, headers)
             else:
                 logger.warning(f"Documento vazio retornado pela unidade {id_unidade}")
 
@@ -164,6 +167,10 @@ async def try_download_with_unidades(
             logger.warning(f"Erro ao tentar unidade {id_unidade}: {e}")
             continue
 
+        finally:
+            if not opened:
+                await chunks.aclose()
+
     return None
 
 
@@ -250,7 +257,7 @@ async def download_specific_document(
             console.print("  • Protocolo incorreto")
             return
 
-        content, used_unidade, headers = result
+        chunks, first_chunk, used_unidade, headers = result
 
         # Extrai nome do arquivo do header Content-Disposition
         content_disposition = headers.get('content-disposition') or headers.get('Content-Disposition')
@@ -267,33 +274,56 @@ async def download_specific_document(
         console.print(f"[green]✓ Documento recebido: {filename}[/green]")
         console.print(f"[green]  Tipo: {mime_type}[/green]\n")
 
-        # Calcula hash
-        hash_sha256 = calculate_sha256(content)
-
         # Prepara diretório de saída
-        protocol_safe = protocol.replace('/', '-').replace('.', '-')
+        protocol_safe = protocol.translate(PROTOCOL_PATH_TABLE)
         output_path = Path(output_dir) / protocol_safe
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Nome do arquivo (usa o filename do header)
         file_path = output_path / filename
 
-        # Salva arquivo
+        # Salva arquivo em streaming, calculando hash e tamanho na mesma passada
         console.print(f"\n[cyan]Salvando documento...[/cyan]")
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        sha256 = hashlib.sha256()
+        size = 0
+        # Grava em um nome temporário e renomeia só no fim: uma falha no meio
+        # não deixa um arquivo truncado com cara de download completo
+        part_path = file_path.with_name(file_path.name + '.part')
+        try:
+            with open(part_path, 'wb') as f:
+                chunk = first_chunk
+                while chunk is not None:
+                    sha256.update(chunk)
+                    size += len(chunk)
+                    # Grava o bloco em uma thread enquanto o próximo chega da rede
+                    write = asyncio.create_task(asyncio.to_thread(f.write, chunk))
+                    try:
+                        chunk = await anext(chunks, None)
+                    finally:
+                        # Mesmo se a leitura falhar, o arquivo só pode ser
+                        # fechado depois que a escrita em andamento terminar
+                        await asyncio.wait([write])
+                    write.result()
+            part_path.replace(file_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        finally:
+            await chunks.aclose()
+
+        hash_sha256 = sha256.hexdigest()
 
         console.print(f"[bold green]✓ Documento salvo com sucesso![/bold green]\n")
         console.print(f"[green]Arquivo:[/green] {file_path}")
         console.print(f"[green]Nome original:[/green] {filename}")
         console.print(f"[green]Tipo:[/green] {mime_type}")
-        console.print(f"[green]Tamanho:[/green] {len(content):,} bytes ({len(content) / 1024:.2f} KB)")
+        console.print(f"[green]Tamanho:[/green] {size:,} bytes ({size / 1024:.2f} KB)")
         console.print(f"[green]SHA256:[/green] {hash_sha256}")
         console.print(f"[green]Unidade:[/green] {used_unidade}\n")
 
         logger.success(
             f"Documento {document_id} baixado: {filename} "
-            f"({mime_type}, {len(content)} bytes, SHA256: {hash_sha256})"
+            f"({mime_type}, {size} bytes, SHA256: {hash_sha256})"
         )
 
 
@@ -339,6 +369,13 @@ Exemplos:
 
     args = parser.parse_args()
 
+    # Event loop do uvloop quando instalado (opcional; não disponível no Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(download_specific_document(
             document_id=args.document_id,
@@ -2,11 +2,12 @@
 Script otimizado para extrair processos gerados do banco SEI e salvar no banco local.
 
 Otimizações implementadas:
-1. Keyset pagination (cursor-based) em vez de OFFSET/LIMIT - O(1) vs O(n)
-2. Server-side cursor para streaming de grandes volumes
+1. Server-side cursor para streaming de grandes volumes (padrão)
+2. Keyset pagination (cursor-based) em vez de OFFSET/LIMIT - O(1) vs O(n) (--keyset)
 3. Conexões persistentes (reutilização de sessões)
 4. COPY protocol para bulk inserts (mais rápido que INSERT)
 5. Processamento em chunks maiores
+6. INSERT ... SELECT via postgres_fdw, sem passar as linhas pelo Python (--fdw)
 
 Este script:
 1. Conecta ao banco SEI (origem)
@@ -15,25 +16,31 @@ Este script:
 4. Salva no banco local na tabela sei_processos_temp_etl
 """
 import sys
-import io
 from pathlib import Path
-from datetime import datetime, timezone
 
 # Adiciona o diretório raiz ao path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import select, func, text
+from sqlalchemy import Text, cast, select, func, text
 from loguru import logger
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from typing import List, Dict, Any
-from datetime import datetime
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
+from typing import Iterable
 
+import asyncio
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config import settings
-from src.database.session import get_sei_engine, get_local_engine
+from src.database.session import (
+    POOL_MAX_CONNECTIONS,
+    get_sei_engine, get_local_engine, get_sei_session, get_async_sei_session, get_async_local_engine
+)
+from src.database.bulk import bulk_copy, bulk_copy_async
 from src.database.models.orm_models import SeiProcessoTempETL
+from src.database.models.declarative_models import SeiAtividades
 from src.database.base import ORMBase
 
 
@@ -43,8 +50,32 @@ console = Console()
 DESCRICAO_FILTER = "Processo @NIVEL_ACESSO@@GRAU_SIGILO@ gerado@DATA_AUTUACAO@@HIPOTESE_LEGAL@"
 
 
-def setup_logger():
-    """Configura o logger."""
+def sql_literal(value) -> str:
+    """Literal SQL (string entre aspas simples) para DDL, que não aceita parâmetros."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+DESCRICAO_FILTER_SQL = sql_literal(DESCRICAO_FILTER)
+
+# Foreign server (postgres_fdw) no banco local apontando para o SEI (--fdw)
+FDW_SERVER = 'sei_fdw'
+FDW_SCHEMA = 'sei_remote'
+
+# Índice parcial recomendado no banco SEI: a extração vira uma varredura de
+# faixa de ids num índice com apenas as linhas filtradas. O SEI é somente
+# leitura para o ETL, então o script apenas verifica e recomenda a DDL.
+PARTIAL_INDEX_DDL = (
+    "CREATE INDEX CONCURRENTLY ix_sei_atividades_processo_gerado "
+    f"ON sei_processo.sei_atividades (id) WHERE descricao_replace = {DESCRICAO_FILTER_SQL}"
+)
+
+
+def setup_logger(debug: bool = False):
+    """Configura o logger.
+
+    Args:
+        debug: Grava também os logs DEBUG (um por batch) no arquivo
+    """
     logger.remove()
     logger.add(
         sys.stderr,
@@ -55,7 +86,11 @@ def setup_logger():
         "logs/extract_processos_gerados_{time}.log",
         rotation="100 MB",
         retention="10 days",
-        level="DEBUG"
+        level="DEBUG" if debug else "INFO",
+        # Escrita em thread própria: leitura/COPY não esperam o disco
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
 
 
@@ -67,119 +102,251 @@ def create_tables_if_not_exists():
     logger.success("Tabelas verificadas/criadas com sucesso!")
 
 
-def get_total_count(sei_engine) -> int:
-    """Retorna o total de registros a serem extraídos usando conexão existente."""
+def get_extraction_stats(sei_engine) -> dict:
+    """
+    Retorna as estatísticas dos registros filtrados em uma única varredura.
+
+    Returns:
+        Dicionário com total, min_id, max_id, min_data e max_data
+    """
     with sei_engine.connect() as conn:
         result = conn.execute(
             text("""
-                SELECT COUNT(*)
+                SELECT COUNT(*) AS total,
+                       MIN(id) AS min_id, MAX(id) AS max_id,
+                       MIN(data_hora) AS min_data, MAX(data_hora) AS max_data
                 FROM sei_processo.sei_atividades
                 WHERE descricao_replace = :desc
             """),
             {"desc": DESCRICAO_FILTER}
         )
-        return result.scalar()
+        return result.one()._asdict()
+
 
+def get_fast_extraction_stats(sei_engine) -> dict:
+    """
+    Estatísticas sem varrer as linhas filtradas (--fast-stats).
 
-def get_min_max_id(sei_engine) -> tuple[int, int]:
-    """Retorna o ID mínimo e máximo dos registros filtrados."""
+    MIN/MAX(id) sem filtro saem das pontas do índice da PK, em tempo
+    O(log n); o range resultante contém o dos registros filtrados e serve
+    para dividir os shards do keyset. O total é a estimativa do planner
+    (EXPLAIN, sem executar a consulta), usada apenas na barra de progresso;
+    o período é calculado ao final, a partir da tabela local.
+    """
     with sei_engine.connect() as conn:
-        result = conn.execute(
+        row = conn.execute(text("SELECT MIN(id), MAX(id) FROM sei_processo.sei_atividades")).one()
+        plan = conn.execute(
             text("""
-                SELECT MIN(id), MAX(id)
-                FROM sei_processo.sei_atividades
-                WHERE descricao_replace = :desc
+                EXPLAIN (FORMAT JSON)
+                SELECT 1 FROM sei_processo.sei_atividades WHERE descricao_replace = :desc
             """),
             {"desc": DESCRICAO_FILTER}
-        )
-        row = result.fetchone()
-        return (row[0] or 0, row[1] or 0)
+        ).scalar()
+    estimated_total = int(plan[0]['Plan']['Plan Rows'])
+    return {
+        'total': None, 'estimated_total': estimated_total,
+        'min_id': row[0], 'max_id': row[1], 'min_data': None, 'max_data': None,
+    }
 
 
-def get_min_max_data_hora(sei_engine) -> tuple[datetime | None, datetime | None]:
-    """Retorna a data mínima e máxima de criação dos processos filtrados."""
+def has_partial_index(sei_engine) -> bool:
+    """Verifica se sei_atividades tem um índice parcial com o predicado de DESCRICAO_FILTER."""
     with sei_engine.connect() as conn:
         result = conn.execute(
             text("""
-                SELECT MIN(data_hora), MAX(data_hora)
-                FROM sei_processo.sei_atividades
-                WHERE descricao_replace = :desc
+                SELECT 1
+                FROM pg_indexes
+                WHERE schemaname = 'sei_processo'
+                  AND tablename = 'sei_atividades'
+                  AND indexdef LIKE '%WHERE%'
+                  AND position(:desc IN indexdef) > 0
+                LIMIT 1
             """),
             {"desc": DESCRICAO_FILTER}
         )
-        row = result.fetchone()
-        return (row[0], row[1])
+        return result.scalar() is not None
 
 
 def truncate_destination_table(local_engine):
-    """Limpa tabela destino usando TRUNCATE (mais rápido que DELETE)."""
+    """
+    Limpa tabela destino usando TRUNCATE (mais rápido que DELETE).
+
+    Também remove os índices secundários da tabela (exceto a PK): manter
+    índice a cada linha do COPY custa mais que construí-lo uma vez ao final
+    (ver `finalize_destination_table`).
+    """
     logger.info("Limpando tabela de destino com TRUNCATE...")
-    with local_engine.connect() as conn:
+    with local_engine.begin() as conn:
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
         conn.execute(text("TRUNCATE TABLE sei_processos_temp_etl RESTART IDENTITY"))
-        conn.commit()
+        for index in SeiProcessoTempETL.__table__.indexes:
+            index.drop(conn, checkfirst=True)
     logger.success("Tabela limpa!")
 
 
-def copy_batch_to_local(local_engine, records: list[dict]):
+def finalize_destination_table(local_engine):
+    """
+    Recria os índices removidos em `truncate_destination_table` e executa
+    VACUUM (FREEZE, ANALYZE) na tabela recém-carregada.
+
+    Sem o ANALYZE o planner só enxergaria a tabela recém-carregada após o
+    autovacuum, e as consultas dos scripts seguintes usariam estimativas da
+    tabela vazia. O FREEZE faz, com as páginas ainda em cache, o trabalho
+    que os leitores seguintes (hint bits) e o autovacuum fariam depois, e
+    marca as páginas como all-visible, habilitando index-only scans.
+    """
+    logger.info("Recriando índices e atualizando estatísticas da tabela de destino...")
+    start = time.perf_counter()
+    with local_engine.begin() as conn:
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
+        # Memória para ordenar cada índice de uma vez, sem spill em disco
+        conn.execute(text("SET LOCAL maintenance_work_mem = '1GB'"))
+        for index in SeiProcessoTempETL.__table__.indexes:
+            index.create(conn, checkfirst=True)
+    # VACUUM não roda dentro de transação
+    with local_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM (FREEZE, ANALYZE) sei_processos_temp_etl"))
+    logger.info(f"Índices e estatísticas atualizados em {time.perf_counter() - start:.2f}s")
+
+
+# Colunas carregadas via COPY em sei_processos_temp_etl (created_at vem do server_default)
+COPY_COLUMNS = ('protocol', 'id_protocolo', 'data_hora', 'tipo_procedimento', 'unidade')
+
+# Página do keyset preparada uma vez por conexão (PREPARE/EXECUTE): o
+# servidor não refaz parse/plan a cada batch. O id vem primeiro para
+# avançar o cursor; as demais colunas seguem a ordem de COPY_COLUMNS.
+# A faixa é (id > $1 AND id <= $2), o que permite dividir a extração em
+# shards de ids contíguos (--workers). O filtro vai como literal, não como
+# parâmetro: após algumas execuções o PostgreSQL passa a usar um plano
+# genérico, que não consegue provar o predicado de um índice parcial.
+KEYSET_STATEMENT = 'sei_keyset_stmt'
+KEYSET_PREPARE_SQL = f"""
+    PREPARE {KEYSET_STATEMENT}(integer, integer, integer) AS
+    SELECT id, protocolo_formatado, id_protocolo::text, data_hora, tipo_procedimento, unidade
+    FROM sei_processo.sei_atividades
+    WHERE descricao_replace = {DESCRICAO_FILTER_SQL} AND id > $1 AND id <= $2
+    ORDER BY id
+    LIMIT $3
+"""
+
+
+def copy_batch_to_local(local_engine, rows: Iterable[tuple]) -> int:
     """
     Insere batch usando COPY protocol (mais rápido que INSERT).
-    Usa StringIO para criar um buffer CSV em memória.
+    Ver `bulk_copy` (fallback para INSERT fora do PostgreSQL).
+
+    Args:
+        local_engine: Engine do banco local
+        rows: Tuplas na ordem de COPY_COLUMNS (ver `processos_gerados_select`),
+            consumidas uma única vez
+
+    Returns:
+        Total de linhas inseridas
     """
-    if not records:
-        return 0
+    return bulk_copy(local_engine, SeiProcessoTempETL.__table__, rows, COPY_COLUMNS)
 
-    # Cria buffer CSV em memória
-    buffer = io.StringIO()
-    now = datetime.now(timezone.utc).isoformat()
 
-    for rec in records:
-        # Escapa valores para formato COPY (tab-separated)
-        protocol = rec['protocol'] or ''
-        id_protocolo = str(rec['id_protocolo']) if rec['id_protocolo'] else ''
-        data_hora = rec['data_hora'].isoformat() if rec['data_hora'] else ''
-        tipo_procedimento = (rec['tipo_procedimento'] or '').replace('\t', ' ').replace('\n', ' ')
-        unidade = (rec['unidade'] or '').replace('\t', ' ').replace('\n', ' ')
+async def copy_batch_to_local_async(local_async_engine, rows: Iterable[tuple]) -> int:
+    """Insere batch via COPY binário (asyncpg) no banco local.
 
-        buffer.write(f"{protocol}\t{id_protocolo}\t{data_hora}\t{tipo_procedimento}\t{unidade}\t{now}\n")
+    Ver `bulk_copy_async`: os valores vão como tipos nativos, sem a
+    serialização CSV de `copy_batch_to_local`.
+    """
+    return await bulk_copy_async(local_async_engine, SeiProcessoTempETL.__table__, rows, COPY_COLUMNS)
 
-    buffer.seek(0)
 
-    # Usa raw connection para COPY
-    raw_conn = local_engine.raw_connection()
-    try:
-        cursor = raw_conn.cursor()
-        cursor.copy_from(
-            buffer,
-            'sei_processos_temp_etl',
-            columns=('protocol', 'id_protocolo', 'data_hora', 'tipo_procedimento', 'unidade', 'created_at'),
-            sep='\t'
-        )
-        raw_conn.commit()
-    finally:
-        raw_conn.close()
+class CopyWriterThread(threading.Thread):
+    """Grava batches via COPY em uma thread própria (produtor/consumidor).
 
-    return len(records)
+    Enquanto um batch é gravado no banco local, a thread principal já lê o
+    próximo do SEI; o psycopg2 libera o GIL durante o I/O de rede, então o
+    tempo total tende a max(leitura, escrita). A fila limitada mantém no
+    máximo `maxsize` batches em memória. Uso como context manager: na saída
+    sinaliza o fim, aguarda a thread e propaga o erro de escrita, se houver.
+    """
 
+    def __init__(self, local_engine, progress, task_id, maxsize: int = 2):
+        super().__init__(name='copy-writer', daemon=True)
+        self.local_engine = local_engine
+        self.progress = progress
+        self.task_id = task_id
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.inserted = 0
+        self.insert_time = 0.0
+        self.last_insert_per_row: float | None = None
+        self.error: BaseException | None = None
+
+    def run(self):
+        batch_num = 0
+        while (rows := self.queue.get()) is not None:
+            if self.error is not None:
+                continue  # Apenas esvazia a fila até o sinal de fim
 
-def extract_with_keyset_pagination(sei_engine, local_engine, batch_size: int = 5000):
+            batch_num += 1
+            try:
+                insert_start = time.perf_counter()
+                batch_inserted = copy_batch_to_local(self.local_engine, rows)
+                insert_elapsed = time.perf_counter() - insert_start
+            except BaseException as e:
+                self.error = e
+                continue
+
+            self.insert_time += insert_elapsed
+            if batch_inserted:
+                self.last_insert_per_row = insert_elapsed / batch_inserted
+            self.inserted += batch_inserted
+            self.progress.update(self.task_id, advance=batch_inserted)
+            logger.debug("Batch {}: insert={:.2f}s", batch_num, insert_elapsed)
+
+    def put(self, rows: list):
+        """Enfileira um batch (bloqueia se a fila estiver cheia)."""
+        if self.error is not None:
+            raise self.error
+        self.queue.put(rows)
+
+    def __enter__(self) -> 'CopyWriterThread':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.queue.put(None)
+        self.join()
+        if exc_type is None and self.error is not None:
+            raise self.error
+
+
+def show_source_stats(sei_engine, fast: bool = False) -> tuple[int | None, int, int]:
     """
-    Extrai dados usando keyset pagination (cursor-based).
+    Exibe estatísticas dos registros a extrair no banco SEI.
 
-    Vantagens sobre OFFSET/LIMIT:
-    - Performance constante O(1) independente do offset
-    - Não "pula" registros se houver inserções durante a extração
-    - Muito mais eficiente para grandes volumes de dados
+    Args:
+        sei_engine: Engine do banco SEI
+        fast: Não varre os registros filtrados (ver `get_fast_extraction_stats`)
+
+    Returns:
+        Tupla (total de registros que atendem ao filtro — estimado com
+        `fast`, ou None se a estimativa for zero —, id mínimo, id máximo)
     """
-    # Obtém estatísticas
     console.print("[yellow]Obtendo estatísticas do banco SEI...[/yellow]")
-    total_records = get_total_count(sei_engine)
-    min_id, max_id = get_min_max_id(sei_engine)
-    min_data, max_data = get_min_max_data_hora(sei_engine)
+    if not has_partial_index(sei_engine):
+        logger.warning(f"Índice parcial para o filtro não encontrado no SEI; recomendado: {PARTIAL_INDEX_DDL}")
+    stats = get_fast_extraction_stats(sei_engine) if fast else get_extraction_stats(sei_engine)
+    total_records = stats['total']
+    min_id, max_id = stats['min_id'] or 0, stats['max_id'] or 0
+    min_data, max_data = stats['min_data'], stats['max_data']
+
+    if total_records is None:
+        # Estimativa só para o progresso; 0 estimado não interrompe a extração
+        estimated_total = stats['estimated_total'] or None
+        console.print(f"[green]Total estimado (planner): {stats['estimated_total']:,}[/green]")
+        console.print(f"[green]Range de IDs (sem filtro): {min_id:,} - {max_id:,}[/green]\n")
+        logger.info(f"Estatísticas rápidas: ~{stats['estimated_total']:,} registros | IDs: {min_id} - {max_id}")
+        return estimated_total, min_id, max_id
 
     if total_records == 0:
         console.print("[red]Nenhum registro encontrado com o filtro especificado![/red]")
         logger.warning("Nenhum registro encontrado para extração")
-        return 0
+        return 0, min_id, max_id
 
     # Formata datas para exibição
     min_data_str = min_data.strftime("%d/%m/%Y %H:%M") if min_data else "N/A"
@@ -191,111 +358,473 @@ def extract_with_keyset_pagination(sei_engine, local_engine, batch_size: int = 5
     logger.info(f"Total: {total_records:,} | IDs: {min_id} - {max_id}")
     logger.info(f"Período dos processos coletados: {min_data_str} até {max_data_str}")
 
-    # Limpa tabela destino antes de inserir
-    with get_local_session() as local_session:
-        logger.info("Limpando tabela de destino...")
-        local_session.query(SeiProcessoTempETL).delete()
-        local_session.commit()
-        logger.success("Tabela limpa!")
-
-    # Processa em batches com keyset pagination
-    batch_size = settings.batch_size
-    total_inserted = 0
-    last_id = 0  # Keyset pagination: start from id > 0
-
-    # Prepare raw SQL insert statement for better performance
-    insert_sql = text("""
-        INSERT INTO sei_processos_temp_etl
-        (protocol, id_protocolo, data_hora, tipo_procedimento, unidade, created_at)
-        VALUES (:protocol, :id_protocolo, :data_hora, :tipo_procedimento, :unidade, :created_at)
-    """)
-
-    with Progress(
+    return total_records, min_id, max_id
+
+
+def processos_gerados_select(batch_size: int):
+    """
+    Consulta (Core) das atividades filtradas, lida via server-side cursor.
+
+    Colunas em vez de entidades: as linhas já são tuplas na ordem de
+    COPY_COLUMNS, sem hidratação ORM. id_protocolo (BIGINT no SEI) é
+    convertido para texto no próprio servidor, já no tipo da coluna de
+    destino, em vez de um `str()` por linha no Python.
+    """
+    return (
+        select(
+            SeiAtividades.protocolo_formatado,
+            cast(SeiAtividades.id_protocolo, Text),
+            SeiAtividades.data_hora,
+            SeiAtividades.tipo_procedimento,
+            SeiAtividades.unidade,
+        )
+        .where(SeiAtividades.descricao_replace == DESCRICAO_FILTER)
+        .order_by(SeiAtividades.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def new_progress() -> Progress:
+    """Cria a barra de progresso usada nas extrações."""
+    return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
         TimeElapsedColumn(),
         console=console
-    ) as progress:
+    )
+
+
+def print_timing_summary(total_read_time: float, total_insert_time: float):
+    """Exibe o tempo gasto em leitura (SEI) e escrita (local)."""
+    console.print(f"\n[bold yellow]⏱ Timing Summary:[/bold yellow]")
+    console.print(f"  [cyan]Total READ time (SEI DB):    {total_read_time:.2f}s[/cyan]")
+    console.print(f"  [cyan]Total INSERT time (Local DB): {total_insert_time:.2f}s[/cyan]")
+    read_pct = (total_read_time / (total_read_time + total_insert_time)) * 100 if (total_read_time + total_insert_time) > 0 else 0
+    console.print(f"  [yellow]Bottleneck: {'READ (SEI)' if read_pct > 50 else 'INSERT (Local)'} ({read_pct:.1f}% read / {100-read_pct:.1f}% insert)[/yellow]")
+
+
+def print_final_summary(local_engine, total_inserted: int):
+    """Exibe o total inserido, a contagem final e o período da tabela local."""
+    console.print(f"\n[bold green]✓ Extração concluída com sucesso![/bold green]")
+    console.print(f"[bold green]  Total de registros inseridos: {total_inserted:,}[/bold green]\n")
+
+    logger.success(f"Extração finalizada: {total_inserted:,} registros inseridos")
+
+    # Mostra estatísticas finais (o período vem da tabela local, já carregada,
+    # em vez de outra varredura no SEI)
+    with local_engine.connect() as conn:
+        total_local, min_data, max_data = conn.execute(
+            text("SELECT COUNT(*), MIN(data_hora), MAX(data_hora) FROM sei_processos_temp_etl")
+        ).one()
+    min_data_str = min_data.strftime("%d/%m/%Y %H:%M") if min_data else "N/A"
+    max_data_str = max_data.strftime("%d/%m/%Y %H:%M") if max_data else "N/A"
+    console.print(f"[cyan]Registros na tabela local: {total_local:,}[/cyan]")
+    console.print(f"[cyan]Período dos processos carregados: {min_data_str} até {max_data_str}[/cyan]\n")
+    logger.info(f"Período dos processos carregados: {min_data_str} até {max_data_str}")
+
+
+def split_id_ranges(min_id: int, max_id: int, parts: int) -> list[tuple[int, int]]:
+    """
+    Divide [min_id, max_id] em até `parts` faixas contíguas (exclusivo, inclusivo].
+
+    Returns:
+        Lista de (após_id, até_id) para `id > após_id AND id <= até_id`
+    """
+    start = min_id - 1
+    span = max_id - start
+    parts = max(1, min(parts, span))
+    bounds = [start + (span * k) // parts for k in range(parts + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+# Limites do batch adaptativo (--adaptive-batch) e batches iniciais ignorados (aquecimento)
+ADAPTIVE_MIN_BATCH = 500
+ADAPTIVE_MAX_BATCH = 50_000
+ADAPTIVE_WARMUP_BATCHES = 3
+
+
+def adapt_batch_size(batch_size: int, read_per_row: float, insert_per_row: float) -> int:
+    """
+    Ajusta o batch pelo custo por linha medido na leitura e na escrita.
+
+    Escrita mais de 2x mais lenta: dobra o batch (amortiza o custo fixo de
+    cada COPY). Leitura mais de 2x mais lenta: reduz à metade (cada página
+    do keyset volta mais rápido e a escrita recebe dados mais cedo).
+    """
+    if insert_per_row > 2 * read_per_row:
+        return min(batch_size * 2, ADAPTIVE_MAX_BATCH)
+    if read_per_row > 2 * insert_per_row:
+        return max(batch_size // 2, ADAPTIVE_MIN_BATCH)
+    return batch_size
+
+
+def read_keyset_range(
+    sei_engine, writer: CopyWriterThread, after_id: int, until_id: int, batch_size: int,
+    adaptive: bool = False
+) -> float:
+    """
+    Lê a faixa (after_id, until_id] do SEI com keyset pagination e enfileira no writer.
+
+    Usa uma conexão DBAPI (psycopg2) dedicada: tuplas direto do cursor, sem
+    hidratação ORM; autocommit evita uma transação longa entre batches. Com
+    `adaptive`, o LIMIT de cada página é recalculado (`adapt_batch_size`).
+
+    Returns:
+        Tempo total de leitura (segundos)
+    """
+    read_time = 0.0
+    last_id = after_id
+    batch_num = 0
+
+    raw_conn = sei_engine.raw_connection()
+    dbapi_conn = raw_conn.driver_connection
+    reusable = False  # Só volta ao pool se o statement foi liberado
+    try:
+        dbapi_conn.autocommit = True
+        with dbapi_conn.cursor() as cursor:
+            cursor.execute(KEYSET_PREPARE_SQL)
+            try:
+                while True:
+                    batch_num += 1
+                    logger.debug("Processando batch {} (last_id: {}, até: {})", batch_num, last_id, until_id)
+
+                    # Extrai batch do SEI usando keyset pagination (WHERE id > last_id)
+                    read_start = time.perf_counter()
+                    cursor.execute(
+                        f"EXECUTE {KEYSET_STATEMENT}(%s, %s, %s)",
+                        (last_id, until_id, batch_size)
+                    )
+                    rows = cursor.fetchall()
+                    read_elapsed = time.perf_counter() - read_start
+                    read_time += read_elapsed
+
+                    if not rows:
+                        break
+                    last_id = rows[-1][0]  # Update cursor for next batch
+
+                    # Grava no banco local (COPY) em paralelo com a próxima leitura
+                    writer.put([row[1:] for row in rows])
+                    logger.debug("Batch {}: read={:.2f}s", batch_num, read_elapsed)
+
+                    if (adaptive and batch_num > ADAPTIVE_WARMUP_BATCHES
+                            and writer.last_insert_per_row is not None):
+                        new_batch_size = adapt_batch_size(
+                            batch_size, read_elapsed / len(rows), writer.last_insert_per_row
+                        )
+                        if new_batch_size != batch_size:
+                            logger.debug("Batch size: {} -> {}", batch_size, new_batch_size)
+                            batch_size = new_batch_size
+            finally:
+                # A conexão volta ao pool: libera o nome do statement. Se a
+                # conexão caiu, não há o que liberar; uma falha aqui não pode
+                # esconder o erro original.
+                if not dbapi_conn.closed:
+                    try:
+                        cursor.execute(f"DEALLOCATE {KEYSET_STATEMENT}")
+                        reusable = True
+                    except Exception as e:
+                        logger.warning(f"Falha ao liberar o statement do keyset: {e}")
+    finally:
+        try:
+            if reusable:
+                dbapi_conn.autocommit = False
+            else:
+                # Conexão caída ou com o statement ainda preparado: descarta
+                raw_conn.invalidate()
+        finally:
+            raw_conn.close()
+
+    return read_time
+
+
+def extract_with_keyset_pagination(
+    sei_engine, local_engine, batch_size: int = 5000, workers: int = 1, fast_stats: bool = False,
+    adaptive: bool = False
+):
+    """
+    Extrai dados usando keyset pagination (cursor-based).
+
+    Vantagens sobre OFFSET/LIMIT:
+    - Performance constante O(1) independente do offset
+    - Não "pula" registros se houver inserções durante a extração
+    - Muito mais eficiente para grandes volumes de dados
+
+    Com `workers > 1` o range de ids é dividido em faixas contíguas, cada
+    uma lida por uma conexão SEI própria e gravada por um COPY próprio no
+    banco local (um backend por faixa), em paralelo. Os tempos do resumo
+    passam a ser a soma entre os workers.
+
+    Com `adaptive` o tamanho das páginas segue a razão entre os custos de
+    leitura e escrita (ver `adapt_batch_size`), a partir de `batch_size`.
+    """
+    total_records, min_id, max_id = show_source_stats(sei_engine, fast=fast_stats)
+    if total_records == 0:
+        return 0
+
+    # Limpa tabela destino antes de inserir
+    truncate_destination_table(local_engine)
+
+    # Cada faixa mantém uma conexão SEI aberta durante toda a carga e usa uma
+    # conexão local a cada COPY
+    if workers > POOL_MAX_CONNECTIONS:
+        logger.warning(f"{workers} workers excedem o pool de conexões; usando {POOL_MAX_CONNECTIONS}")
+        workers = POOL_MAX_CONNECTIONS
+    id_ranges = split_id_ranges(min_id, max_id, workers)
+
+    with new_progress() as progress:
 
         task = progress.add_task(
-            f"[cyan]Extraindo (batch: {batch_size:,})...",
+            f"[cyan]Extraindo (batch: {batch_size:,}, workers: {len(id_ranges)})...",
+            total=total_records
+        )
+
+        def extract_range(id_range: tuple[int, int]) -> tuple[float, int, float]:
+            with CopyWriterThread(local_engine, progress, task) as writer:
+                read_time = read_keyset_range(sei_engine, writer, *id_range, batch_size, adaptive=adaptive)
+            return read_time, writer.inserted, writer.insert_time
+
+        if len(id_ranges) == 1:
+            results = [extract_range(id_ranges[0])]
+        else:
+            logger.info(f"Extraindo {len(id_ranges)} faixas de ids em paralelo")
+            logger.debug("Faixas de ids: {}", id_ranges)
+            with ThreadPoolExecutor(max_workers=len(id_ranges), thread_name_prefix='keyset-shard') as executor:
+                results = list(executor.map(extract_range, id_ranges))
+
+        total_read_time = sum(read_time for read_time, _, _ in results)
+        total_inserted = sum(inserted for _, inserted, _ in results)
+        print_timing_summary(total_read_time, sum(insert_time for _, _, insert_time in results))
+
+    finalize_destination_table(local_engine)
+    print_final_summary(local_engine, total_inserted)
+    return total_inserted
+
+
+def extract_with_server_cursor(sei_engine, local_engine, batch_size: int = 10000, fast_stats: bool = False):
+    """
+    Extrai dados em uma única consulta lida via server-side cursor.
+
+    Com `yield_per` o SQLAlchemy usa um cursor nomeado no psycopg2
+    (stream_results): um único DECLARE percorre o índice uma vez, buscando
+    `4 * batch_size` linhas por FETCH e gravando em batches de `batch_size`,
+    sem carregar o resultado inteiro em memória nem reexecutar a consulta a
+    cada batch. A sessão fica aberta (autocommit=False) até o fim do
+    streaming para manter o cursor vivo. Modo padrão do script; o keyset
+    (--keyset) fica como alternativa retomável.
+
+    No banco SEI, um índice parcial (PARTIAL_INDEX_DDL, verificado em
+    `show_source_stats`) evita filtrar descricao_replace durante a varredura
+    em ordem de id.
+    """
+    total_records, _, _ = show_source_stats(sei_engine, fast=fast_stats)
+    if total_records == 0:
+        return 0
+
+    # Limpa tabela destino antes de inserir
+    truncate_destination_table(local_engine)
+
+    with new_progress() as progress:
+
+        task = progress.add_task(
+            f"[cyan]Extraindo via cursor (batch: {batch_size:,})...",
             total=total_records
         )
 
         total_read_time = 0.0
-        total_insert_time = 0.0
-        batch_num = 0
 
-        while True:
-            batch_num += 1
-            logger.debug(f"Processando batch {batch_num} (last_id: {last_id})")
+        with CopyWriterThread(local_engine, progress, task) as writer, get_sei_session() as sei_session:
+            # O cursor é lido até o fim: planeja para o total, não para as primeiras linhas
+            sei_session.execute(text("SET LOCAL cursor_tuple_fraction = 1.0"))
+            sei_session.execute(text("SET LOCAL work_mem = '256MB'"))
 
-            # Extrai batch do SEI usando keyset pagination (WHERE id > last_id)
-            records_to_insert: List[Dict[str, Any]] = []
+            partitions = sei_session.execute(processos_gerados_select(batch_size * 4)).partitions(batch_size)
 
+            batch_num = 0
             read_start = time.perf_counter()
-            with get_sei_session() as sei_session:
-                stmt = (
-                    select(SeiAtividades)
-                    .where(SeiAtividades.descricao_replace == descricao_filter)
-                    .where(SeiAtividades.id > last_id)
-                    .order_by(SeiAtividades.id)
-                    .limit(batch_size)
-                )
-                atividades = sei_session.execute(stmt).scalars().all()
-
-                # Extrai dados DENTRO da sessão, enquanto os objetos ainda estão atachados
-                now = datetime.utcnow()
-                for atividade in atividades:
-                    records_to_insert.append({
-                        'protocol': atividade.protocolo_formatado,
-                        'id_protocolo': str(atividade.id_protocolo),  # Convert to string for the table
-                        'data_hora': atividade.data_hora,
-                        'tipo_procedimento': atividade.tipo_procedimento,
-                        'unidade': atividade.unidade,
-                        'created_at': now,
-                    })
-                    last_id = atividade.id  # Update cursor for next batch
-
-            read_elapsed = time.perf_counter() - read_start
-            total_read_time += read_elapsed
-
-            if not records_to_insert:
-                break
-
-            # Insere no banco local usando raw SQL executemany
+            for rows in partitions:
+                batch_num += 1
+                read_elapsed = time.perf_counter() - read_start
+                total_read_time += read_elapsed
+
+                # Grava no banco local (COPY) em paralelo com a próxima leitura
+                writer.put(rows)
+                logger.debug("Batch {}: read={:.2f}s", batch_num, read_elapsed)
+
+                read_start = time.perf_counter()
+
+        total_inserted = writer.inserted
+        print_timing_summary(total_read_time, writer.insert_time)
+
+    finalize_destination_table(local_engine)
+    print_final_summary(local_engine, total_inserted)
+    return total_inserted
+
+
+async def extract_async_pipeline(sei_engine, local_engine, batch_size: int = 10000, fast_stats: bool = False):
+    """
+    Extrai dados com leitura assíncrona (asyncpg) sobreposta à escrita local.
+
+    Um produtor lê o SEI via stream (server-side cursor, `yield_per`) e
+    enfileira os batches convertidos; um consumidor grava cada batch com
+    COPY binário, também via asyncpg. Enquanto um batch é gravado, o próximo já está
+    sendo lido, usando as duas conexões ao mesmo tempo. A fila limitada
+    mantém no máximo dois batches em memória.
+    """
+    total_records, _, _ = show_source_stats(sei_engine, fast=fast_stats)
+    if total_records == 0:
+        return 0
+
+    # Limpa tabela destino antes de inserir
+    truncate_destination_table(local_engine)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    timings = {'read': 0.0, 'insert': 0.0}
+
+    async def produce():
+        async with get_async_sei_session() as sei_session:
+            result = await sei_session.stream(processos_gerados_select(batch_size))
+
+            read_start = time.perf_counter()
+            async for rows in result.partitions():
+                timings['read'] += time.perf_counter() - read_start
+                await queue.put(rows)
+                read_start = time.perf_counter()
+        await queue.put(None)
+
+    async def consume(progress, task) -> int:
+        local_async_engine = get_async_local_engine()
+        inserted = 0
+        batch_num = 0
+        while (rows := await queue.get()) is not None:
+            batch_num += 1
             insert_start = time.perf_counter()
-            engine = get_local_engine()
-            with engine.begin() as conn:
-                conn.execute(insert_sql, records_to_insert)
+            batch_inserted = await copy_batch_to_local_async(local_async_engine, rows)
             insert_elapsed = time.perf_counter() - insert_start
-            total_insert_time += insert_elapsed
-
-            batch_inserted = len(records_to_insert)
-            total_inserted += batch_inserted
+            timings['insert'] += insert_elapsed
 
+            inserted += batch_inserted
             progress.update(task, advance=batch_inserted)
-            logger.debug(f"Batch {batch_num}: read={read_elapsed:.2f}s, insert={insert_elapsed:.2f}s")
+            logger.debug("Batch {}: insert={:.2f}s", batch_num, insert_elapsed)
+        return inserted
 
-        # Print timing summary
-        console.print(f"\n[bold yellow]⏱ Timing Summary:[/bold yellow]")
-        console.print(f"  [cyan]Total READ time (SEI DB):    {total_read_time:.2f}s[/cyan]")
-        console.print(f"  [cyan]Total INSERT time (Local DB): {total_insert_time:.2f}s[/cyan]")
-        read_pct = (total_read_time / (total_read_time + total_insert_time)) * 100 if (total_read_time + total_insert_time) > 0 else 0
-        console.print(f"  [yellow]Bottleneck: {'READ (SEI)' if read_pct > 50 else 'INSERT (Local)'} ({read_pct:.1f}% read / {100-read_pct:.1f}% insert)[/yellow]")
+    with new_progress() as progress:
 
-    console.print(f"\n[bold green]✓ Extração concluída com sucesso![/bold green]")
-    console.print(f"[bold green]  Total de registros inseridos: {total_inserted:,}[/bold green]\n")
+        task = progress.add_task(
+            f"[cyan]Extraindo async (batch: {batch_size:,})...",
+            total=total_records
+        )
 
-    logger.success(f"Extração finalizada: {total_inserted:,} registros inseridos")
+        # TaskGroup: se o produtor ou o consumidor falhar, o outro é
+        # cancelado (o produtor não fica bloqueado numa fila cheia)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                consumer = tg.create_task(consume(progress, task))
+        except* Exception as eg:
+            raise eg.exceptions[0]
+        total_inserted = consumer.result()
 
-    # Mostra estatísticas finais
-    with local_engine.connect() as conn:
-        result = conn.execute(text("SELECT COUNT(*) FROM sei_processos_temp_etl"))
-        total_local = result.scalar()
-        console.print(f"[cyan]Registros na tabela local: {total_local:,}[/cyan]\n")
+        print_timing_summary(timings['read'], timings['insert'])
+
+    finalize_destination_table(local_engine)
+    print_final_summary(local_engine, total_inserted)
+    return total_inserted
+
+
+def setup_sei_foreign_table(local_engine, fetch_size: int):
+    """
+    Cria no banco local a foreign table sei_remote.sei_atividades (postgres_fdw).
+
+    O foreign server é recriado a cada execução a partir das configurações
+    atuais do SEI (host, credenciais) e removido ao fim da carga por
+    `teardown_sei_foreign_table`. Requer um usuário local com permissão
+    para CREATE EXTENSION / CREATE SERVER (superusuário no docker-compose).
+
+    Args:
+        local_engine: Engine do banco local
+        fetch_size: Linhas buscadas do SEI por round-trip pelo postgres_fdw
+    """
+    logger.info("Configurando postgres_fdw para o banco SEI...")
+    sei_schema = local_engine.dialect.identifier_preparer.quote_schema(settings.sei_db_schema)
+    with local_engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgres_fdw"))
+        conn.execute(text(f"DROP SERVER IF EXISTS {FDW_SERVER} CASCADE"))
+        conn.execute(text(
+            f"CREATE SERVER {FDW_SERVER} FOREIGN DATA WRAPPER postgres_fdw OPTIONS ("
+            f"host {sql_literal(settings.sei_db_host)}, port {sql_literal(settings.sei_db_port)}, "
+            f"dbname {sql_literal(settings.sei_db_name)}, fetch_size {sql_literal(fetch_size)})"
+        ))
+        conn.execute(text(
+            f"CREATE USER MAPPING FOR CURRENT_USER SERVER {FDW_SERVER} OPTIONS ("
+            f"user {sql_literal(settings.sei_db_user)}, password {sql_literal(settings.sei_db_password)})"
+        ))
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {FDW_SCHEMA}"))
+        conn.execute(text(
+            f"IMPORT FOREIGN SCHEMA {sei_schema} LIMIT TO (sei_atividades) "
+            f"FROM SERVER {FDW_SERVER} INTO {FDW_SCHEMA}"
+        ))
+
+
+def teardown_sei_foreign_table(local_engine):
+    """
+    Remove o foreign server, a user mapping e a foreign table do SEI.
+
+    A user mapping guarda a senha do banco SEI; nada do FDW fica no banco
+    local depois da carga.
+
+    Args:
+        local_engine: Engine do banco local
+    """
+    with local_engine.begin() as conn:
+        conn.execute(text(f"DROP SERVER IF EXISTS {FDW_SERVER} CASCADE"))
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {FDW_SCHEMA} CASCADE"))
+    logger.debug("postgres_fdw removido do banco local")
+
+
+def extract_with_fdw(sei_engine, local_engine, batch_size: int = 10000, fast_stats: bool = False):
+    """
+    Extrai dados com um único INSERT ... SELECT na foreign table do SEI.
+
+    As linhas vão do SEI ao banco local direto entre os dois servidores
+    PostgreSQL (postgres_fdw), sem materialização no Python. O filtro é
+    enviado ao SEI (pushdown) e as linhas chegam em lotes de `batch_size`
+    (fetch_size). Não há progresso por batch: a carga é um único comando.
+    """
+    total_records, _, _ = show_source_stats(sei_engine, fast=fast_stats)
+    if total_records == 0:
+        return 0
+
+    # Configura o FDW antes do TRUNCATE: se falhar, a tabela local fica intacta
+    setup_sei_foreign_table(local_engine, fetch_size=batch_size)
+    try:
+        truncate_destination_table(local_engine)
+
+        with new_progress() as progress:
+            progress.add_task(f"[cyan]Extraindo via postgres_fdw (fetch: {batch_size:,})...", total=None)
+
+            insert_start = time.perf_counter()
+            with local_engine.begin() as conn:
+                conn.execute(text("SET LOCAL synchronous_commit = off"))
+                result = conn.execute(
+                    text(f"""
+                        INSERT INTO sei_processos_temp_etl ({', '.join(COPY_COLUMNS)})
+                        SELECT protocolo_formatado, id_protocolo::text, data_hora, tipo_procedimento, unidade
+                        FROM {FDW_SCHEMA}.sei_atividades
+                        WHERE descricao_replace = :desc
+                    """),
+                    {"desc": DESCRICAO_FILTER}
+                )
+                total_inserted = result.rowcount
+            logger.info(f"INSERT ... SELECT via postgres_fdw em {time.perf_counter() - insert_start:.2f}s")
+    finally:
+        # Não deixa a senha do SEI gravada na user mapping do banco local
+        teardown_sei_foreign_table(local_engine)
+
+    finalize_destination_table(local_engine)
+    print_final_summary(local_engine, total_inserted)
+    return total_inserted
 
 
 def main():
@@ -303,10 +832,32 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Extração otimizada de processos gerados do SEI")
+    parser.add_argument(
+        "--keyset",
+        action="store_true",
+        help="Usa keyset pagination (uma consulta por batch; alternativa retomável ao cursor)"
+    )
     parser.add_argument(
         "--cursor",
         action="store_true",
-        help="Usa server-side cursor (recomendado para volumes muito grandes)"
+        help="Usa server-side cursor (padrão; mantido por compatibilidade)"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Lê o SEI via asyncpg sobrepondo leitura e escrita (pipeline assíncrono)"
+    )
+    parser.add_argument(
+        "--fdw",
+        action="store_true",
+        help="Carrega com um único INSERT ... SELECT via postgres_fdw no banco local"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Faixas de ids extraídas em paralelo, cada uma com seu COPY (implica --keyset)"
     )
     parser.add_argument(
         "--batch-size",
@@ -314,11 +865,45 @@ def main():
         default=None,
         help="Tamanho do batch (default: settings.batch_size)"
     )
+    parser.add_argument(
+        "--adaptive-batch",
+        action="store_true",
+        help="Ajusta o batch pela razão entre tempo de leitura e de escrita (implica --keyset)"
+    )
+    parser.add_argument(
+        "--fast-stats",
+        action="store_true",
+        help="Não varre o SEI para total/período antes da extração (progresso com total estimado)"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Grava logs DEBUG por batch no arquivo de log"
+    )
 
     args = parser.parse_args()
 
+    batch_size = args.batch_size or settings.batch_size
+
     try:
-        extract_and_load(use_server_cursor=args.cursor)
+        setup_logger(debug=args.debug)
+        if args.fdw:
+            extract_with_fdw(
+                get_sei_engine(), get_local_engine(), batch_size=batch_size, fast_stats=args.fast_stats
+            )
+        elif args.use_async:
+            asyncio.run(extract_async_pipeline(
+                get_sei_engine(), get_local_engine(), batch_size=batch_size, fast_stats=args.fast_stats
+            ))
+        elif args.keyset or args.workers > 1 or args.adaptive_batch:
+            extract_with_keyset_pagination(
+                get_sei_engine(), get_local_engine(), batch_size=batch_size, workers=args.workers,
+                fast_stats=args.fast_stats, adaptive=args.adaptive_batch
+            )
+        else:
+            extract_with_server_cursor(
+                get_sei_engine(), get_local_engine(), batch_size=batch_size, fast_stats=args.fast_stats
+            )
     except KeyboardInterrupt:
         console.print("\n[yellow]Processo interrompido pelo usuário.[/yellow]")
         logger.warning("Processo interrompido pelo usuário")
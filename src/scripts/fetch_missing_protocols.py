@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from sqlalchemy import select, exists, literal
 from sqlalchemy.dialects.postgresql import insert
 from loguru import logger
 from rich.console import Console
@@ -25,6 +26,7 @@ from rich.table import Table
 
 from src.config import settings
 from src.database.session import get_local_session
+from src.database.bulk import bulk_insert, bulk_upsert
 from src.database.models.orm_models import (
     SeiProcessoTempETL,
     SeiProcesso,
@@ -55,7 +57,7 @@ def setup_logger():
 
 
 def clean_json_for_postgres(obj: Any) -> Any:
-    """Remove None keys from dictionaries recursively."""
+    """Remove None keys from dictionaries recursively (and NUL chars, rejected by JSONB)."""
     if isinstance(obj, dict):
         return {
             str(k) if k is not None else 'null': clean_json_for_postgres(v)
@@ -63,6 +65,9 @@ def clean_json_for_postgres(obj: Any) -> Any:
         }
     elif isinstance(obj, list):
         return [clean_json_for_postgres(item) for item in obj]
+    elif isinstance(obj, str):
+        # JSONB não aceita \u0000 em strings
+        return obj.replace('\x00', '')
     else:
         return obj
 
@@ -153,23 +158,8 @@ async def fetch_processo_completo(
             # Consulta processo
             processo_data = await client.consultar_processo(id_tentativa, protocol)
 
-            # Busca documentos e andamentos em paralelo
-            documentos_task = client.listar_documentos(id_tentativa, protocol)
-            andamentos_task = client.listar_andamentos(id_tentativa, protocol)
-
-            documentos_data, andamentos_data = await asyncio.gather(
-                documentos_task,
-                andamentos_task,
-                return_exceptions=True
-            )
-
-            if isinstance(documentos_data, Exception):
-                logger.error(f"Erro ao buscar documentos de {protocol}: {documentos_data}")
-                documentos_data = []
-
-            if isinstance(andamentos_data, Exception):
-                logger.error(f"Erro ao buscar andamentos de {protocol}: {andamentos_data}")
-                andamentos_data = []
+            # Busca documentos e andamentos (páginas de ambos no mesmo pool)
+            documentos_data, andamentos_data = await client.fetch_process_pages(id_tentativa, protocol)
 
             logger.success(
                 f"[{protocol}] ✓ Consultado via unidade {sigla_tentativa}: "
@@ -244,16 +234,14 @@ def save_processo_to_db(data: Dict[str, Any], protocol: str):
             stmt = stmt.on_conflict_do_update(
                 index_elements=['protocol'],
                 set_=processo_dict
-            )
-            session.execute(stmt)
-            session.flush()
+            ).returning(SeiProcesso.id)
+            processo_id = session.execute(stmt).scalar_one()
 
-            processo = session.query(SeiProcesso).filter_by(protocol=protocol).first()
-
-            # Salva documentos
+            # Salva documentos (upsert em lote)
+            documentos_rows = []
             for doc_api in documentos_api:
                 doc_dict = {
-                    'processo_id': processo.id,
+                    'processo_id': processo_id,
                     'protocol': protocol,
                     'id_documento': int(doc_api.get('IdDocumento', 0)),
                     'numero_documento': doc_api.get('Numero'),
@@ -268,21 +256,18 @@ def save_processo_to_db(data: Dict[str, Any], protocol: str):
                     'raw_api_response': clean_json_for_postgres(doc_api),
                     'status': 'pending',
                 }
+                documentos_rows.append(doc_dict)
 
-                stmt = insert(SeiDocumento).values(**doc_dict)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['id_documento'],
-                    set_={k: v for k, v in doc_dict.items() if k != 'status'}
-                )
-                session.execute(stmt)
+            bulk_upsert(session, SeiDocumento, documentos_rows, ['id_documento'], update_exclude=('status',))
 
-            # Salva andamentos
+            # Salva andamentos (INSERT em lote)
+            andamentos_rows = []
             for and_api in andamentos_api:
                 usuario_obj = and_api.get('Usuario', {})
                 usuario_str = usuario_obj.get('Sigla') or usuario_obj.get('Nome') if isinstance(usuario_obj, dict) else str(usuario_obj) if usuario_obj else None
 
                 and_dict = {
-                    'processo_id': processo.id,
+                    'processo_id': processo_id,
                     'protocol': protocol,
                     'id_andamento': int(and_api.get('IdAndamento', 0)),
                     'tipo_andamento': and_api.get('Tarefa'),
@@ -295,7 +280,9 @@ def save_processo_to_db(data: Dict[str, Any], protocol: str):
                     'raw_api_response': clean_json_for_postgres(and_api),
                 }
 
-                session.add(SeiAndamento(**and_dict))
+                andamentos_rows.append(and_dict)
+
+            bulk_insert(session, SeiAndamento, andamentos_rows)
 
             # Atualiza status ETL
             etl_dict = {
@@ -348,14 +335,6 @@ def check_and_save_to_temp_etl(protocol: str, row_data: Dict[str, Any]) -> bool:
     """
     with get_local_session() as session:
         try:
-            # Verifica se já existe
-            existing = session.query(SeiProcessoTempETL).filter_by(protocol=protocol).first()
-
-            if existing:
-                logger.debug(f"[{protocol}] Já existe em sei_processos_temp_etl")
-                return True
-
-            # Não existe - insere
             temp_dict = {
                 'protocol': protocol,
                 'id_protocolo': safe_str(row_data.get('id_unidade_geradora')),
@@ -365,8 +344,20 @@ def check_and_save_to_temp_etl(protocol: str, row_data: Dict[str, Any]) -> bool:
                 'created_at': datetime.now(timezone.utc)
             }
 
-            session.add(SeiProcessoTempETL(**temp_dict))
+            # INSERT ... SELECT ... WHERE NOT EXISTS: verifica e insere em um único comando
+            # (protocol não é único em sei_processos_temp_etl, então não há ON CONFLICT)
+            stmt = insert(SeiProcessoTempETL).from_select(
+                list(temp_dict),
+                select(*(literal(value, SeiProcessoTempETL.__table__.c[col].type) for col, value in temp_dict.items()))
+                .where(~exists().where(SeiProcessoTempETL.protocol == protocol))
+            ).returning(SeiProcessoTempETL.id)
+            inserted = session.execute(stmt).first() is not None
             session.commit()
+
+            if not inserted:
+                logger.debug(f"[{protocol}] Já existe em sei_processos_temp_etl")
+                return True
+
             logger.debug(f"[{protocol}] Inserido em sei_processos_temp_etl")
             return False
 
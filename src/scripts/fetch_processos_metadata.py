@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 from loguru import logger
 from rich.console import Console
@@ -31,6 +31,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 
 from src.config import settings
 from src.database.session import get_local_session, get_local_engine
+from src.database.bulk import bulk_insert, bulk_upsert
 from src.database.models.orm_models import (
     SeiProcessoTempETL,
     SeiProcesso,
@@ -74,7 +75,7 @@ class BulkWriteStats:
 # =============================================================================
 
 def clean_json_for_postgres(obj: Any) -> Any:
-    """Remove None keys from dictionaries recursively."""
+    """Remove None keys from dictionaries recursively (and NUL chars, rejected by JSONB)."""
     if isinstance(obj, dict):
         return {
             str(k) if k is not None else 'null': clean_json_for_postgres(v)
@@ -82,6 +83,9 @@ def clean_json_for_postgres(obj: Any) -> Any:
         }
     elif isinstance(obj, list):
         return [clean_json_for_postgres(item) for item in obj]
+    elif isinstance(obj, str):
+        # JSONB não aceita \u0000 em strings
+        return obj.replace('\x00', '')
     else:
         return obj
 
@@ -193,24 +197,8 @@ async def fetch_processo_completo(
             # 1. Consulta processo
             processo_data = await client.consultar_processo(id_tentativa, protocol)
 
-            # 2. Em paralelo: documentos + andamentos
-            documentos_task = client.listar_documentos(id_tentativa, protocol)
-            andamentos_task = client.listar_andamentos(id_tentativa, protocol)
-
-            documentos_data, andamentos_data = await asyncio.gather(
-                documentos_task,
-                andamentos_task,
-                return_exceptions=True
-            )
-
-            # Trata exceções
-            if isinstance(documentos_data, Exception):
-                logger.error(f"Erro ao buscar documentos de {protocol}: {documentos_data}")
-                documentos_data = []
-
-            if isinstance(andamentos_data, Exception):
-                logger.error(f"Erro ao buscar andamentos de {protocol}: {andamentos_data}")
-                andamentos_data = []
+            # 2. Documentos + andamentos (páginas de ambos no mesmo pool)
+            documentos_data, andamentos_data = await client.fetch_process_pages(id_tentativa, protocol)
 
             logger.success(
                 f"[{protocol}] ✓ Consultado via {sigla_tentativa}: "
@@ -353,16 +341,10 @@ def bulk_save_processos(results: List[ProcessoResult]) -> BulkWriteStats:
                 stmt = stmt.on_conflict_do_update(
                     index_elements=['protocol'],
                     set_={k: stmt.excluded[k] for k in processos_data[0].keys() if k != 'protocol'}
-                )
-                conn.execute(stmt)
+                ).returning(SeiProcesso.id, SeiProcesso.protocol)
 
-                # Busca IDs dos processos inseridos
-                protocols = [r.protocol for r in successful]
-                result = conn.execute(
-                    text("SELECT id, protocol FROM sei_processos WHERE protocol = ANY(:protocols)"),
-                    {"protocols": protocols}
-                )
-                protocol_to_id = {row[1]: row[0] for row in result}
+                # IDs dos processos inseridos/atualizados via RETURNING
+                protocol_to_id = {row.protocol: row.id for row in conn.execute(stmt)}
 
                 # Prepara documentos e andamentos com IDs corretos
                 documentos_data = []
@@ -384,20 +366,12 @@ def bulk_save_processos(results: List[ProcessoResult]) -> BulkWriteStats:
                         )
 
                 # Bulk insert documentos (upsert)
-                if documentos_data:
-                    stmt = insert(SeiDocumento).values(documentos_data)
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=['id_documento'],
-                        set_={k: stmt.excluded[k] for k in documentos_data[0].keys()
-                              if k not in ('id_documento', 'status')}
-                    )
-                    conn.execute(stmt)
-                    stats.documentos_saved = len(documentos_data)
+                stats.documentos_saved = bulk_upsert(
+                    conn, SeiDocumento, documentos_data, ['id_documento'], update_exclude=('status',)
+                )
 
                 # Bulk insert andamentos (sem upsert, podem haver duplicatas)
-                if andamentos_data:
-                    conn.execute(insert(SeiAndamento).values(andamentos_data))
-                    stats.andamentos_saved = len(andamentos_data)
+                stats.andamentos_saved = bulk_insert(conn, SeiAndamento, andamentos_data)
 
                 stats.processos_saved = len(successful)
 
@@ -0,0 +1,88 @@
+"""
+Script para identificar processos que não constam no consolidado CGFR.
+
+Equivalente SQL de `analyze_missing_protocols.py`: em vez de ler dois CSVs
+e calcular a diferença de conjuntos em Python, executa um único anti-join
+(sei_processos LEFT JOIN sei_consolidado_cgfr ... IS NULL) no banco local.
+O script baseado em CSV continua disponível para triagem offline.
+
+Este script:
+1. Conecta ao banco local
+2. Busca processos do ano informado sem linha correspondente em sei_consolidado_cgfr
+3. Salva o resultado em data/missing_protocols_<ano>.csv (coluna processo_formatado,
+   formato esperado por check_protocols_in_database.py)
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
+from sqlalchemy import select
+from loguru import logger
+from rich.console import Console
+
+from src.database.session import get_local_engine
+from src.database.models.orm_models import SeiProcesso, SeiConsolidadoCGFR
+
+console = Console()
+
+
+def build_missing_protocols_query(ano: int):
+    """Monta o anti-join de processos do ano ausentes no consolidado CGFR.
+
+    Args:
+        ano: Ano do protocolo (ex: 2025 para 00002.000092/2025-74)
+
+    Returns:
+        Statement SELECT com as colunas do CSV de saída
+    """
+    return (
+        select(
+            SeiProcesso.protocol.label('processo_formatado'),
+            SeiProcesso.especificacao,
+            SeiProcesso.tipo_procedimento.label('tipo_processo'),
+            SeiProcesso.data_abertura,
+            SeiProcesso.unidade_geradora,
+        )
+        .outerjoin(
+            SeiConsolidadoCGFR,
+            SeiConsolidadoCGFR.sei_protocolo_formatado == SeiProcesso.protocol
+        )
+        .where(SeiConsolidadoCGFR.id.is_(None))
+        .where(SeiProcesso.protocol.like(f'%/{ano}-%'))
+        .order_by(SeiProcesso.protocol)
+    )
+
+
+def main():
+    """Função principal."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Processos ausentes no consolidado CGFR (anti-join SQL)")
+    parser.add_argument("--ano", type=int, default=2025, help="Ano dos protocolos (default: 2025)")
+    parser.add_argument("--output", type=str, default=None, help="CSV de saída (default: data/missing_protocols_<ano>.csv)")
+    args = parser.parse_args()
+
+    output_file = Path(args.output or f"data/missing_protocols_{args.ano}.csv")
+
+    try:
+        stmt = build_missing_protocols_query(args.ano)
+        with get_local_engine().connect() as conn:
+            result = conn.execute(stmt)
+            missing_df = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+    except Exception as e:
+        console.print(f"\n[bold red]Erro durante a consulta: {e}[/bold red]")
+        logger.exception("Erro ao buscar protocolos ausentes")
+        sys.exit(1)
+
+    console.print(f"[green]Protocolos de {args.ano} ausentes no consolidado CGFR: {len(missing_df):,}[/green]")
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    missing_df.to_csv(output_file, index=False)
+    console.print(f"[cyan]Resultados salvos em: {output_file}[/cyan]")
+    logger.success(f"{len(missing_df):,} protocolos ausentes salvos em {output_file}")
+
+
+if __name__ == "__main__":
+    main()